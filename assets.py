@@ -0,0 +1,133 @@
+"""Assets statiques adressés par contenu.
+
+Les fichiers (photo, CV…) sont copiés dans ``static/`` sous un nom qui contient
+l'empreinte de leur contenu, puis servis par le serveur statique de Streamlit
+(``server.enableStaticServing``). Une même URL désigne donc toujours les mêmes
+octets, et un nouveau contenu change d'URL.
+
+Le serveur statique de Streamlit (1.66) n'envoie pas de ``Cache-Control`` :
+seuls ``ETag`` / ``Last-Modified`` reviennent, et le navigateur applique son
+cache heuristique puis revalide (304). Un cache ``immutable`` long demande un
+reverse proxy ou un CDN devant ``app/static/``, ce que ces URL permettent
+sans risque.
+"""
+import contextlib
+import hashlib
+import os
+import re
+import shutil
+import threading
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+STATIC_DIR = os.path.join(BASE_DIR, "static")
+STATIC_URL = "app/static"
+
+DIGEST_LEN = 12
+
+# chemin absolu -> (mtime_ns, taille, nom publié, empreinte)
+_published: dict[str, tuple[int, int, str, str]] = {}
+_lock = threading.Lock()
+
+
+@contextlib.contextmanager
+def atomic_path(dest: str):
+    """Chemin temporaire à remplir, renommé en `dest` en fin de bloc.
+
+    Lecteurs et autres processus voient l'ancien fichier ou le nouveau,
+    jamais un fichier partiel ; en cas d'erreur, le temporaire est supprimé.
+    """
+    tmp = f"{dest}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        yield tmp
+        os.replace(tmp, dest)
+    except BaseException:
+        try:
+            os.remove(tmp)
+        except FileNotFoundError:
+            pass
+        raise
+
+
+def atomic_write(dest: str, data: bytes | str) -> None:
+    """Écrit `data` dans `dest` via ``atomic_path`` (texte en UTF-8)."""
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    with atomic_path(dest) as tmp, open(tmp, "wb") as f:
+        f.write(data)
+
+
+def file_digest(path: str) -> str:
+    """Empreinte SHA-256 (tronquée) du contenu d'un fichier."""
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 16), b""):
+            h.update(chunk)
+    return h.hexdigest()[:DIGEST_LEN]
+
+
+def _prune(stem: str, ext: str, keep: str) -> None:
+    """Supprime les anciennes versions publiées d'un même fichier (et leurs
+    variantes précompressées)."""
+    pattern = re.compile(
+        rf"^{re.escape(stem)}\.[0-9a-f]{{{DIGEST_LEN}}}{re.escape(ext)}(\.gz|\.br)?$"
+    )
+    for f in os.listdir(STATIC_DIR):
+        if f not in (keep, f"{keep}.gz", f"{keep}.br") and pattern.match(f):
+            try:
+                os.remove(os.path.join(STATIC_DIR, f))
+            except OSError:
+                pass
+
+
+def publish(path: str) -> tuple[str, str] | None:
+    """Publie `path` dans static/ et retourne (nom publié, empreinte).
+
+    La copie n'est refaite que si le mtime ou la taille du fichier source
+    ont changé ; sinon un simple ``os.stat`` suffit. Les fichiers texte
+    reçoivent leurs variantes ``.gz`` / ``.br`` (voir ``compress.py``).
+    """
+    path = os.path.abspath(path)
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None
+
+    with _lock:
+        hit = _published.get(path)
+        if hit and hit[0] == st.st_mtime_ns and hit[1] == st.st_size:
+            return hit[2], hit[3]
+
+        digest = file_digest(path)
+        stem, ext = os.path.splitext(os.path.basename(path))
+        ext = ext.lower()
+        name = f"{stem}.{digest}{ext}"
+        dest = os.path.join(STATIC_DIR, name)
+        if not os.path.isfile(dest):
+            os.makedirs(STATIC_DIR, exist_ok=True)
+            with atomic_path(dest) as tmp:
+                shutil.copyfile(path, tmp)
+            _prune(stem, ext, name)
+        from compress import precompress   # compress importe atomic_write d'ici
+        precompress(dest)
+
+        _published[path] = (st.st_mtime_ns, st.st_size, name, digest)
+        return name, digest
+
+
+def static_url(path: str) -> str | None:
+    """URL adressée par contenu d'un fichier local, ou None s'il n'existe pas
+    ou ne peut pas être publié (static/ en lecture seule…) : chaque appelant a
+    son repli (CDN, Google Fonts, download_button).
+
+    Le paramètre ``v`` répète l'empreinte (clé de cache des proxys qui
+    ignorent le nom) ; Streamlit ne l'interprète pas et n'ajoute aucun en-tête
+    de cache (voir l'en-tête du module).
+    """
+    try:
+        published = publish(path)
+    except OSError:
+        return None
+    if published is None:
+        return None
+    name, digest = published
+    return f"{STATIC_URL}/{name}?v={digest}"
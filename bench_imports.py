@@ -0,0 +1,94 @@
+"""Mesure du coût d'import au démarrage (``python -X importtime``).
+
+    python bench_imports.py [--runs 5] [--top 15] [--json rapport.json] [module ...]
+
+Sans module : exécute ``portfolio.py`` en mode « bare » (sans serveur), ce qui
+couvre les imports et le premier rendu d'un démarrage à froid. Chaque mesure
+a lieu dans un nouvel interpréteur ; on garde la médiane des exécutions.
+
+Le rapport liste les modules les plus coûteux (temps cumulé) et signale les
+paquets lourds qui ne devraient pas être chargés au démarrage.
+"""
+import argparse
+import json
+import os
+import re
+import statistics
+import subprocess
+import sys
+import time
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Paquets qui n'ont rien à faire dans un démarrage à froid de l'app.
+HEAVY = ("requests", "pandas", "numpy", "sklearn", "matplotlib", "scipy")
+
+_LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)")
+
+
+def run_once(modules: list[str]) -> tuple[float, dict[str, int]]:
+    """Durée totale (s) et temps cumulé (µs) de chaque module de premier niveau."""
+    if modules:
+        code = "; ".join(f"import {m}" for m in modules)
+    else:
+        code = "import runpy; runpy.run_path('portfolio.py', run_name='__main__')"
+    env = dict(os.environ, PYTHONDONTWRITEBYTECODE="1")
+    start = time.perf_counter()
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=BASE_DIR, env=env, capture_output=True, text=True,
+    )
+    elapsed = time.perf_counter() - start
+    if proc.returncode:
+        raise SystemExit(proc.stderr[-2000:])
+
+    cumulative = {}
+    for m in _LINE.finditer(proc.stderr):
+        name = m.group(4)
+        cumulative[name] = max(cumulative.get(name, 0), int(m.group(2)))
+    return elapsed, cumulative
+
+
+def benchmark(modules: list[str], runs: int) -> dict:
+    walls, samples = [], []
+    run_once(modules)  # remplit le cache de pages de l'OS
+    for _ in range(runs):
+        wall, cumulative = run_once(modules)
+        walls.append(wall)
+        samples.append(cumulative)
+    names = set().union(*samples)
+    median = {
+        name: statistics.median(s.get(name, 0) for s in samples) for name in names
+    }
+    return {
+        "target": " ".join(modules) or "portfolio.py",
+        "runs": runs,
+        "wall_ms": 1000 * statistics.median(walls),
+        "modules_us": dict(sorted(median.items(), key=lambda kv: -kv[1])),
+        "heavy_loaded": sorted(name for name in names if name in HEAVY),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Temps d'import au démarrage de l'app.")
+    parser.add_argument("modules", nargs="*", help="modules à importer (défaut : portfolio.py)")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=15)
+    parser.add_argument("--json", metavar="FICHIER", help="écrit le rapport complet en JSON")
+    args = parser.parse_args()
+
+    report = benchmark(args.modules, args.runs)
+    print(f"{report['target']} : {report['wall_ms']:.0f} ms (médiane de {args.runs})")
+    for name, us in list(report["modules_us"].items())[:args.top]:
+        print(f"  {us / 1000:8.1f} ms  {name}")
+    if report["heavy_loaded"]:
+        print(f"Paquets lourds chargés : {', '.join(report['heavy_loaded'])}")
+    else:
+        print("Aucun paquet lourd chargé.")
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,240 @@
+"""Benchmark de rendu sans navigateur (``streamlit.testing.v1.AppTest``).
+
+    python bench_render.py [--cold 3] [--warm 10] [--out bench_report.json]
+                           [--baseline reference.json [--save-baseline]] [--threshold 0.25]
+
+Pour chaque page de ``PAGES`` :
+
+* *cold* : premier rendu dans un nouvel interpréteur (imports, caches vides) ;
+* *warm* : rendus suivants dans le même processus (caches chauds).
+
+On relève la durée (ms), le pic mémoire Python (tracemalloc, Kio) et le
+volume de HTML émis (octets). Le scénario ``contact:submit`` remplit et
+envoie le formulaire ; Formspree est remplacé par un serveur HTTP local.
+
+Avec ``--baseline``, les médianes sont comparées au rapport de référence :
+toute hausse au-delà de ``--threshold`` (25 % par défaut) fait échouer le
+script (code de sortie 1), comme une référence absente (code 2). Les durées
+dépendent de la machine : la référence s'enregistre sur la machine de
+mesure, avec ``--baseline fichier.json --save-baseline``.
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+APP = os.path.join(BASE_DIR, "portfolio.py")
+SUBMIT = "contact:submit"
+METRICS = ("wall_ms", "peak_kib", "html_bytes")
+
+
+# ──────────────────────────────────────────────
+# FORMSPREE LOCAL
+# ──────────────────────────────────────────────
+class _FormspreeStub(BaseHTTPRequestHandler):
+    received = 0
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        type(self).received += 1
+        body = b'{"ok": true}'
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def start_formspree_stub() -> ThreadingHTTPServer:
+    """Serveur local qui accepte tout ; l'app y est redirigée par l'environnement."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _FormspreeStub)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    os.environ["FORMSPREE_ID"] = "bench"
+    os.environ["FORMSPREE_URL"] = f"http://127.0.0.1:{server.server_port}/f/{{form_id}}"
+    os.environ["PORTFOLIO_OUTBOX_PATH"] = os.path.join(
+        tempfile.mkdtemp(prefix="bench-outbox-"), "outbox.sqlite3"
+    )
+    # Anti-abus neutralisé : chaque envoi mesuré doit atteindre l'outbox.
+    os.environ.setdefault("PORTFOLIO_DEDUP_WINDOW", "0")
+    os.environ.setdefault("PORTFOLIO_RATE_BURST", "1000000")
+    return server
+
+
+# ──────────────────────────────────────────────
+# MESURE
+# ──────────────────────────────────────────────
+def render(scenario: str) -> dict:
+    """Un rendu complet de `scenario` (nom de page ou ``contact:submit``)."""
+    from streamlit.testing.v1 import AppTest
+
+    page = scenario.split(":")[0]
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    start = time.perf_counter()
+    at = AppTest.from_file(APP, default_timeout=60)
+    at.query_params["page"] = page
+    at.run()
+    if scenario == SUBMIT:
+        tag = uuid.uuid4().hex[:8]
+        at.text_input[0].input("Bench")
+        at.text_input[1].input(f"bench+{tag}@example.com")
+        at.text_input[2].input("Benchmark")
+        at.text_area[0].input(f"Message {tag} envoyé par le benchmark de rendu.")
+        at.button[0].click()
+        at.run()
+    wall = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    if at.exception:
+        raise RuntimeError(f"{scenario} : {at.exception[0].value}")
+    if scenario == SUBMIT and not at.success:
+        raise RuntimeError(f"{scenario} : le message n'a pas été accepté")
+    return {
+        "wall_ms": 1000 * wall,
+        "peak_kib": peak / 1024,
+        "html_bytes": sum(len(e.proto.body.encode()) for e in at.get("html")),
+    }
+
+
+def cold_render(scenario: str) -> dict:
+    """Rendu dans un interpréteur neuf (voir ``--child``)."""
+    proc = subprocess.run(
+        [sys.executable, __file__, "--child", scenario],
+        cwd=BASE_DIR, capture_output=True, text=True, env=os.environ.copy(),
+    )
+    if proc.returncode:
+        raise RuntimeError(proc.stderr[-2000:])
+    return json.loads(proc.stdout.strip().splitlines()[-1])
+
+
+def summarize(samples: list[dict]) -> dict:
+    out = {"runs": len(samples)}
+    for key in METRICS:
+        values = [s[key] for s in samples]
+        out[key] = statistics.median(values)
+        out[f"{key}_max"] = max(values)
+    return out
+
+
+def run_suite(scenarios: list[str], cold: int, warm: int) -> dict:
+    results = {}
+    for scenario in scenarios:
+        cold_samples = [cold_render(scenario) for _ in range(cold)]
+        render(scenario)  # amorçage du processus courant
+        warm_samples = [render(scenario) for _ in range(warm)]
+        results[scenario] = {
+            "cold": summarize(cold_samples) if cold_samples else None,
+            "warm": summarize(warm_samples) if warm_samples else None,
+        }
+        print(_line(scenario, results[scenario]), flush=True)
+    import streamlit
+
+    return {
+        "python": platform.python_version(),
+        "streamlit": streamlit.__version__,
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "scenarios": results,
+    }
+
+
+def _line(scenario: str, result: dict) -> str:
+    parts = [f"{scenario:<16}"]
+    for mode in ("cold", "warm"):
+        r = result[mode]
+        if r:
+            parts.append(f"{mode} {r['wall_ms']:7.1f} ms {r['peak_kib']:8.0f} Kio")
+    html = (result["warm"] or result["cold"])["html_bytes"]
+    parts.append(f"{html:7.0f} o HTML")
+    return "  ".join(parts)
+
+
+# ──────────────────────────────────────────────
+# COMPARAISON
+# ──────────────────────────────────────────────
+def compare(report: dict, baseline: dict, threshold: float) -> list[str]:
+    """Régressions (médianes) au-delà du seuil relatif."""
+    regressions = []
+    for scenario, result in report["scenarios"].items():
+        ref = baseline.get("scenarios", {}).get(scenario)
+        if not ref:
+            continue
+        for mode in ("cold", "warm"):
+            if not (result.get(mode) and ref.get(mode)):
+                continue
+            for key in METRICS:
+                old, new = ref[mode][key], result[mode][key]
+                if old and (new - old) / old > threshold:
+                    regressions.append(
+                        f"{scenario} [{mode}] {key} : {old:.1f} → {new:.1f} "
+                        f"(+{100 * (new - old) / old:.0f} %)"
+                    )
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark de rendu des pages (AppTest).")
+    parser.add_argument("--cold", type=int, default=3, help="rendus à froid par page")
+    parser.add_argument("--warm", type=int, default=10, help="rendus à chaud par page")
+    parser.add_argument("--pages", nargs="*", help="scénarios (défaut : toutes les pages + envoi)")
+    parser.add_argument("--out", default=os.path.join(BASE_DIR, "bench_report.json"))
+    parser.add_argument("--baseline", help="rapport de référence (comparaison, ou "
+                        "destination de --save-baseline)")
+    parser.add_argument("--threshold", type=float, default=0.25)
+    parser.add_argument("--save-baseline", action="store_true",
+                        help="enregistre ce rapport comme nouvelle référence")
+    parser.add_argument("--child", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.save_baseline and not args.baseline:
+        parser.error("--save-baseline demande --baseline")
+    if args.baseline and not args.save_baseline and not os.path.isfile(args.baseline):
+        parser.error(f"référence introuvable : {args.baseline}")
+
+    if args.child:
+        print(json.dumps(render(args.child)))
+        return
+
+    from static_pages import PAGES
+
+    server = start_formspree_stub()
+    scenarios = args.pages or [*PAGES.values(), SUBMIT]
+    report = run_suite(scenarios, args.cold, args.warm)
+    server.shutdown()
+    report["formspree_posts"] = _FormspreeStub.received
+
+    with open(args.out, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    print(f"Rapport : {args.out}")
+
+    if args.save_baseline:
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"Référence enregistrée : {args.baseline}")
+        return
+    if not args.baseline:
+        return
+    with open(args.baseline, encoding="utf-8") as f:
+        regressions = compare(report, json.load(f), args.threshold)
+    if regressions:
+        print(f"Régressions (> {100 * args.threshold:.0f} %) :")
+        for line in regressions:
+            print(f"  {line}")
+        sys.exit(1)
+    print(f"Aucune régression au-delà de {100 * args.threshold:.0f} %.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""Micro-benchmark de la validation du formulaire et du lien mailto.
+
+    python bench_validation.py [--repeat 5] [--json rapport.json]
+
+Mesure (µs par appel, meilleure des ``--repeat`` séries) :
+
+* ``validate`` sur un formulaire valide et sur un formulaire invalide ;
+* ``validate_batch`` sur un lot de 1 000 messages (rejeu d'outbox) ;
+* ``mailto_url`` face à l'encodage seul du corps par ``urllib.parse.quote``,
+  sur des messages de 100, 1 000 et 10 000 caractères (``MAX_LENGTHS``).
+"""
+import argparse
+import json
+import timeit
+import urllib.parse
+
+from validation import (
+    MAX_LENGTHS, mailto_body, mailto_url, normalize, validate, validate_batch,
+)
+
+VALID = {
+    "name": "Jean Dupont",
+    "email": "jean.dupont@example.com",
+    "subject": "Opportunité",
+    "phone": "+237 6 12 34 56 78",
+    "message": "Bonjour, je souhaiterais discuter d'un projet de data science.",
+}
+INVALID = {"name": " ", "email": "jean@", "subject": "", "phone": "abc", "message": "court"}
+MESSAGE_SIZES = (100, 1_000, MAX_LENGTHS["message"])
+
+
+def per_call(func, repeat: int, number: int) -> float:
+    """Durée (µs) d'un appel : meilleure série."""
+    return 1e6 * min(timeit.repeat(func, repeat=repeat, number=number)) / number
+
+
+def long_message(size: int) -> str:
+    text = "Déjà vu : été, naïve & co — ligne /chemin?x=1\n"
+    return (text * (size // len(text) + 1))[:size]
+
+
+def run(repeat: int) -> dict:
+    valid, invalid = normalize(VALID), normalize(INVALID)
+    assert not validate(valid) and len(validate(invalid)) == 5
+    batch = [VALID, INVALID] * 500
+
+    results = {
+        "validate_valid_us": per_call(lambda: validate(valid), repeat, 20_000),
+        "validate_invalid_us": per_call(lambda: validate(invalid), repeat, 20_000),
+        "validate_batch_1000_us": per_call(lambda: validate_batch(batch), repeat, 20),
+        "mailto": {},
+    }
+    for size in MESSAGE_SIZES:
+        body = mailto_body({**valid, "message": long_message(size)})
+        url = mailto_url("a@b.c", "Sujet", body)
+        if not url.endswith(urllib.parse.quote(body)):
+            raise SystemExit(f"mailto_url diffère de urllib.parse.quote ({size} caractères)")
+        number = max(1, 200_000 // size)
+        results["mailto"][size] = {
+            "mailto_us": per_call(lambda: mailto_url("a@b.c", "Sujet", body), repeat, number),
+            "quote_us": per_call(lambda: urllib.parse.quote(body), repeat, number),
+            "url_chars": len(url),
+        }
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Micro-benchmark de validation.py.")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--json", help="écrit aussi le rapport dans ce fichier")
+    args = parser.parse_args()
+
+    results = run(args.repeat)
+    print(f"validate (valide)      {results['validate_valid_us']:10.2f} µs")
+    print(f"validate (invalide)    {results['validate_invalid_us']:10.2f} µs")
+    print(f"validate_batch (1000)  {results['validate_batch_1000_us']:10.0f} µs")
+    for size, r in results["mailto"].items():
+        print(f"mailto {size:>7} car.   {r['mailto_us']:10.1f} µs   {r['url_chars']:>6} car."
+              f"   (quote seul {r['quote_us']:.1f} µs)")
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
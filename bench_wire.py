@@ -0,0 +1,270 @@
+"""Octets sur le fil, par page, avant / après compression.
+
+    python bench_wire.py [--pages home about ...] [--port 8597] [--json rapport.json]
+
+Le script lance ``streamlit run portfolio.py`` et place devant lui un proxy
+TCP local qui compte les octets réellement reçus par le client :
+
+* websocket : premier rendu de la page (trames ``ForwardMsg``, dont le
+  HTML des ``st.html`` et la CSS inline) sans extension, puis avec
+  ``permessage-deflate`` ; l'extension doit être acceptée par le serveur
+  (``server.enableWebsocketCompression``), sinon le script échoue ;
+* assets ``app/static/`` qu'un navigateur charge au premier affichage :
+  corps de réponse en identité, compressé à la volée par Streamlit (gzip),
+  et taille des variantes précompressées ``.gz`` / ``.br`` (voir
+  ``compress.py``) que servirait un reverse proxy.
+
+Pour les assets, le navigateur simulé (écran de ``VIEWPORT`` px, densité 1,
+AVIF accepté) ne retient qu'un candidat par ``<picture>`` / ``srcset``, et
+ignore les images ``loading="lazy"`` et les liens ``<a href>`` (CV
+téléchargé au clic) ; les ``url()`` des ``<style>`` (polices) comptent.
+Le rapport JSON liste aussi tous les assets cités (``referenced``).
+"""
+import argparse
+import asyncio
+import json
+import os
+import re
+import sys
+import urllib.request
+from html.parser import HTMLParser
+
+from loadtest import DEFAULT_PAGES, Session, launch_server
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+STATIC_DIR = os.path.join(BASE_DIR, "static")
+_STATIC_REF = re.compile(r'app/static/([^"?\s,)]+)')
+_CSS_URL = re.compile(r"url\(['\"]?([^'\")]+)")
+VIEWPORT = 1280
+
+
+def _slot_width(sizes: str) -> float:
+    """Largeur d'affichage (px) d'après un ``sizes`` simple (« 140px », « 90vw »)."""
+    size = sizes.strip()
+    if size.endswith("px"):
+        return float(size[:-2])
+    if size.endswith("vw"):
+        return VIEWPORT * float(size[:-2]) / 100
+    return VIEWPORT
+
+
+def pick_candidate(srcset: str, sizes: str, src: str | None = None) -> str | None:
+    """URL qu'un navigateur de densité 1 retient dans `srcset` (sinon `src`)."""
+    candidates = []
+    for entry in filter(None, (e.strip() for e in srcset.split(","))):
+        url, _, descriptor = entry.partition(" ")
+        descriptor = descriptor.strip() or "1x"
+        candidates.append((float(descriptor[:-1]), descriptor[-1], url))
+    if not candidates:
+        return src
+    if candidates[0][1] == "x":
+        return min(candidates, key=lambda c: abs(c[0] - 1))[2]
+    slot = _slot_width(sizes)
+    fitting = [c for c in candidates if c[0] >= slot]
+    return (min(fitting) if fitting else max(candidates))[2]
+
+
+class BrowserFetches(HTMLParser):
+    """Assets ``app/static/`` chargés au premier affichage d'un fragment HTML."""
+
+    def __init__(self):
+        super().__init__()
+        self.urls: list[str] = []
+        self._sources: list[dict] | None = None   # <source> du <picture> ouvert
+        self._style = False
+
+    def handle_starttag(self, tag, attrs):
+        attrs = {k: v or "" for k, v in attrs}
+        if tag == "picture":
+            self._sources = []
+        elif tag == "source" and self._sources is not None:
+            self._sources.append(attrs)
+        elif tag == "img":
+            sources, self._sources = self._sources or [], None
+            if attrs.get("loading") == "lazy":
+                return
+            chosen = sources[0] if sources else attrs   # 1re <source> : format accepté
+            url = pick_candidate(chosen.get("srcset", ""), chosen.get("sizes", ""),
+                                 attrs.get("src"))
+            if url:
+                self.urls.append(url)
+        elif tag == "style":
+            self._style = True
+
+    def handle_endtag(self, tag):
+        if tag == "style":
+            self._style = False
+
+    def handle_data(self, data):
+        if self._style:
+            self.urls += _CSS_URL.findall(data)
+
+
+def fetched_assets(html: str) -> set[str]:
+    parser = BrowserFetches()
+    parser.feed(html)
+    return {m for url in parser.urls for m in _STATIC_REF.findall(url)}
+
+
+# ──────────────────────────────────────────────
+# PROXY DE COMPTAGE
+# ──────────────────────────────────────────────
+class WireCounter:
+    """Proxy TCP vers le serveur : compte les octets reçus par le client."""
+
+    def __init__(self, target_port: int):
+        self.target_port = target_port
+        self.downstream = 0
+        self.port = 0
+        self.server = None
+
+    async def start(self) -> "WireCounter":
+        self.server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+        self.port = self.server.sockets[0].getsockname()[1]
+        return self
+
+    async def _handle(self, client_reader, client_writer) -> None:
+        reader, writer = await asyncio.open_connection("127.0.0.1", self.target_port)
+        await asyncio.gather(
+            self._pipe(client_reader, writer, count=False),
+            self._pipe(reader, client_writer, count=True),
+        )
+
+    async def _pipe(self, reader, writer, count: bool) -> None:
+        try:
+            while data := await reader.read(1 << 16):
+                if count:
+                    self.downstream += len(data)
+                writer.write(data)
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+
+class WireSession(Session):
+    """Session qui relève aussi les assets statiques des ``st.html`` : cités,
+    et chargés par un navigateur."""
+
+    def __init__(self, url: str, compression: str | None):
+        super().__init__(url, compression)
+        self.assets: set[str] = set()
+        self.referenced: set[str] = set()
+
+    def _collect(self, delta, alerts: list, errors: list) -> None:
+        element = delta.new_element
+        if element.WhichOneof("type") == "html":
+            body = element.html.body
+            self.referenced.update(_STATIC_REF.findall(body))
+            self.assets.update(fetched_assets(body))
+        super()._collect(delta, alerts, errors)
+
+
+# ──────────────────────────────────────────────
+# MESURES
+# ──────────────────────────────────────────────
+async def websocket_bytes(counter: WireCounter, page: str, compression: str | None) -> dict:
+    """Premier rendu de `page` dans une session neuve."""
+    async with WireSession(f"ws://127.0.0.1:{counter.port}/_stcore/stream", compression) as s:
+        extensions = s.ws.response.headers.get("Sec-WebSocket-Extensions", "")
+        before = counter.downstream
+        result = await s.rerun(page)
+        if result["errors"]:
+            raise RuntimeError(f"{page} : {result['errors']}")
+        return {
+            "wire": counter.downstream - before,
+            "payload": result["bytes"],
+            "extensions": extensions,
+            "assets": sorted(s.assets),
+            "referenced": sorted(s.referenced),
+        }
+
+
+def _fetch(url: str, encoding: str) -> tuple[int, str]:
+    request = urllib.request.Request(url, headers={"Accept-Encoding": encoding})
+    with urllib.request.urlopen(request, timeout=10) as response:
+        # urllib ne décompresse pas : longueur du corps tel que transmis.
+        return len(response.read()), response.headers.get("Content-Encoding", "")
+
+
+def static_bytes(port: int, assets: list[str]) -> dict:
+    totals = {"identity": 0, "gzip": 0, "precompressed_gz": 0, "precompressed_br": 0}
+    for name in assets:
+        url = f"http://127.0.0.1:{port}/app/static/{name}"
+        identity, _ = _fetch(url, "identity")
+        totals["identity"] += identity
+        totals["gzip"] += _fetch(url, "gzip")[0]
+        for suffix in ("gz", "br"):
+            variant = os.path.join(STATIC_DIR, f"{name}.{suffix}")
+            totals[f"precompressed_{suffix}"] += (
+                os.path.getsize(variant) if os.path.isfile(variant) else identity
+            )
+    return totals
+
+
+async def measure(port: int, pages: list[str]) -> dict:
+    counter = await WireCounter(port).start()
+    results = {}
+    for page in pages:
+        plain = await websocket_bytes(counter, page, None)
+        deflate = await websocket_bytes(counter, page, "deflate")
+        if "permessage-deflate" not in deflate["extensions"]:
+            raise SystemExit(
+                "permessage-deflate non négocié : vérifiez "
+                "server.enableWebsocketCompression (.streamlit/config.toml)."
+            )
+        assets = sorted(set(plain["assets"]) | set(deflate["assets"]))
+        results[page] = {
+            "payload": plain["payload"],
+            "ws_plain": plain["wire"],
+            "ws_deflate": deflate["wire"],
+            "extensions": deflate["extensions"],
+            "assets": assets,
+            "referenced": sorted(set(plain["referenced"]) | set(deflate["referenced"])),
+            "static": await asyncio.to_thread(static_bytes, port, assets),
+        }
+    counter.server.close()
+    return results
+
+
+def _ratio(after: int, before: int) -> str:
+    return f"{100 * (1 - after / before):5.1f} %" if before else "    —"
+
+
+def print_report(results: dict) -> None:
+    print(f"{'page':<12}{'ws brut':>10}{'deflate':>10}{'gain':>9}"
+          f"{'static':>10}{'gzip':>9}{'.gz':>9}{'.br':>9}")
+    for page, r in results.items():
+        st = r["static"]
+        print(f"{page:<12}{r['ws_plain']:>10}{r['ws_deflate']:>10}"
+              f"{_ratio(r['ws_deflate'], r['ws_plain']):>9}"
+              f"{st['identity']:>10}{st['gzip']:>9}"
+              f"{st['precompressed_gz']:>9}{st['precompressed_br']:>9}")
+    plain = sum(r["ws_plain"] for r in results.values())
+    deflate = sum(r["ws_deflate"] for r in results.values())
+    print(f"{'total':<12}{plain:>10}{deflate:>10}{_ratio(deflate, plain):>9}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Octets sur le fil par page.")
+    parser.add_argument("--pages", nargs="*", default=DEFAULT_PAGES)
+    parser.add_argument("--port", type=int, default=8597)
+    parser.add_argument("--json", help="écrit aussi le rapport dans ce fichier")
+    args = parser.parse_args()
+
+    server = launch_server(args.port)
+    try:
+        results = asyncio.run(measure(args.port, args.pages))
+    finally:
+        server.terminate()
+        server.wait(timeout=10)
+    print_report(results)
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+        print(f"Rapport : {args.json}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
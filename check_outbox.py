@@ -0,0 +1,109 @@
+"""Vérification de bout en bout de l'outbox contre un faux Formspree local.
+
+    python check_outbox.py
+
+Scénarios (délais de backoff réduits) :
+
+* 503 puis 200 → envoyé à la 2e tentative ;
+* 400 → échec définitif dès la 1re tentative, sans nouvel essai ;
+* erreur SQLite à l'enregistrement du résultat → le worker survit, réessaie
+  l'écriture, et le message n'est pas laissé « sending ».
+
+Code de sortie 1 au premier écart.
+"""
+import os
+import sqlite3
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import outbox
+
+
+class _ScriptedFormspree(BaseHTTPRequestHandler):
+    """Répond, pour chaque formulaire, selon la liste de statuts prévue."""
+
+    script: dict[str, list[int]] = {}
+    calls: dict[str, int] = {}
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        form = self.path.rsplit("/", 1)[-1]
+        n = self.calls.get(form, 0)
+        self.calls[form] = n + 1
+        statuses = self.script.get(form, [200])
+        status = statuses[min(n, len(statuses) - 1)]
+        body = b'{"ok": true}' if status == 200 else b'{"error": "refus"}'
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def _row(path: str, msg_id: int) -> tuple[str, int]:
+    with sqlite3.connect(path) as db:
+        return db.execute("SELECT status, attempts FROM outbox WHERE id = ?", (msg_id,)).fetchone()
+
+
+def _wait_for(path: str, msg_id: int, statuses: set[str], timeout: float = 10) -> tuple[str, int]:
+    deadline = time.time() + timeout
+    row = _row(path, msg_id)
+    while row[0] not in statuses and time.time() < deadline:
+        time.sleep(0.05)
+        row = _row(path, msg_id)
+    return row
+
+
+def main() -> None:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _ScriptedFormspree)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    os.environ["FORMSPREE_URL"] = f"http://127.0.0.1:{server.server_port}/f/{{form_id}}"
+    import contact   # lit FORMSPREE_URL à l'import
+
+    outbox.BACKOFF_BASE = 0.05
+    path = os.path.join(tempfile.mkdtemp(prefix="check-outbox-"), "outbox.sqlite3")
+    box = outbox.Outbox(path, contact._deliver, workers=1)
+
+    # Échec d'écriture du résultat, une fois : le worker doit survivre.
+    finish, failures = box._finish, []
+
+    def flaky_finish(*args):
+        if not failures:
+            failures.append(args)
+            raise sqlite3.OperationalError("database is locked")
+        finish(*args)
+
+    box._finish = flaky_finish
+    box.start()
+
+    payload = contact.build_payload("Check", "check@example.com", "Outbox", "", "Message de vérification.")
+    _ScriptedFormspree.script = {"retry": [503, 200], "reject": [400], "locked": [200]}
+    checks = []
+    locked = box.enqueue({"form_id": "locked", "payload": payload})
+    checks.append(("erreur SQLite au résultat", _wait_for(path, locked, {"sent", "failed"}), ("sent", 1)))
+    retried = box.enqueue({"form_id": "retry", "payload": payload})
+    checks.append(("503 puis 200", _wait_for(path, retried, {"sent", "failed"}), ("sent", 2)))
+    rejected = box.enqueue({"form_id": "reject", "payload": payload})
+    checks.append(("400", _wait_for(path, rejected, {"sent", "failed"}), ("failed", 1)))
+    box.stop(timeout=5)
+    server.shutdown()
+
+    calls = _ScriptedFormspree.calls
+    checks.append(("appels Formspree", (calls.get("retry"), calls.get("reject")), (2, 1)))
+    checks.append(("échecs SQLite simulés", len(failures), 1))
+    ok = True
+    for name, got, expected in checks:
+        status = "ok" if got == expected else "ÉCHEC"
+        ok &= got == expected
+        print(f"{status:<6} {name:<28} obtenu {got}, attendu {expected}")
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""Variantes précompressées (gzip, brotli) des assets statiques.
+
+    python compress.py [dossier ...]      # défaut : static/ et dist/
+
+À côté de chaque fichier texte (CSS, SVG, HTML…) sont écrits ``fichier.gz``
+et, si le module ``brotli`` est installé, ``fichier.br``. Les noms publiés
+contiennent déjà l'empreinte du contenu (voir ``assets.py``) : une variante
+n'est donc produite qu'une fois par version, puis servie telle quelle par le
+reverse proxy (``gzip_static`` / ``brotli_static`` de nginx) ou le CDN, sans
+recompression à chaque requête.
+
+Le serveur statique de Streamlit ne sait pas servir ces variantes ; il
+compresse à la volée. Les payloads ``st.html`` (CSS inline, fragments)
+voyagent, eux, dans le websocket : voir ``server.enableWebsocketCompression``
+dans ``.streamlit/config.toml`` et ``bench_wire.py``.
+"""
+import gzip
+import os
+import sys
+
+from assets import atomic_write
+
+try:
+    import brotli
+except ImportError:  # dépendance de build facultative
+    brotli = None
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Formats déjà compressés (images, woff2, PDF) : rien à gagner.
+COMPRESSIBLE = {".css", ".js", ".mjs", ".html", ".svg", ".json", ".txt", ".xml", ".ttf", ".otf"}
+MIN_SIZE = 256
+SUFFIXES = (".gz", ".br")
+
+
+def _gzip(data: bytes) -> bytes:
+    return gzip.compress(data, compresslevel=9, mtime=0)   # sortie reproductible
+
+
+def _brotli(data: bytes) -> bytes:
+    return brotli.compress(data, quality=11)
+
+
+def encoders() -> dict:
+    """Suffixe → fonction de compression disponible."""
+    found = {".gz": _gzip}
+    if brotli is not None:
+        found[".br"] = _brotli
+    return found
+
+
+def is_compressible(path: str) -> bool:
+    return os.path.splitext(path)[1].lower() in COMPRESSIBLE
+
+
+def precompress(path: str) -> list[str]:
+    """Écrit les variantes compressées de `path` ; retourne celles produites
+    ou déjà à jour. Une variante qui ne gagne rien n'est pas gardée."""
+    if not is_compressible(path):
+        return []
+    st = os.stat(path)
+    if st.st_size < MIN_SIZE:
+        return []
+    data = None
+    variants = []
+    for suffix, encode in encoders().items():
+        dest = path + suffix
+        try:
+            if os.stat(dest).st_mtime_ns >= st.st_mtime_ns:
+                variants.append(dest)
+                continue
+        except FileNotFoundError:
+            pass
+        if data is None:
+            with open(path, "rb") as f:
+                data = f.read()
+        packed = encode(data)
+        if len(packed) >= len(data):
+            continue
+        atomic_write(dest, packed)
+        variants.append(dest)
+    return variants
+
+
+def precompress_tree(root: str) -> list[str]:
+    """Précompresse tous les fichiers éligibles sous `root`."""
+    variants = []
+    for folder, _, files in os.walk(root):
+        for name in sorted(files):
+            if not name.endswith(SUFFIXES):
+                variants += precompress(os.path.join(folder, name))
+    return variants
+
+
+def main() -> None:
+    roots = sys.argv[1:] or [os.path.join(BASE_DIR, d) for d in ("static", "dist")]
+    if brotli is None:
+        print("Module brotli absent : variantes gzip seulement (pip install -r requirements-build.txt).")
+    for root in roots:
+        if not os.path.isdir(root):
+            continue
+        for variant in precompress_tree(root):
+            source = variant[:-3]
+            print(f"{os.path.relpath(variant, BASE_DIR):<60} "
+                  f"{os.path.getsize(source):>8} → {os.path.getsize(variant):>8} o")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,241 @@
+"""Envoi des messages du formulaire de contact via Formspree.
+
+Les messages passent par une outbox durable (voir ``outbox.py``) : le script
+Streamlit rend la main dès que le message est enregistré, l'appel HTTP est
+fait en arrière-plan.
+
+``requests`` n'est importé qu'au premier envoi : afficher l'app (même la page
+de contact) ne coûte pas son temps d'import.
+"""
+from __future__ import annotations
+
+import os
+import threading
+import time
+from typing import TYPE_CHECKING
+
+import metrics
+from outbox import Outbox
+from throttle import Deduplicator, RateLimited, RateLimiter
+from validation import FIELDS, ValidationError, check
+
+if TYPE_CHECKING:
+    import requests
+
+# ── FORMSPREE : vrai envoi d'email sans SMTP ──────────────────────────────────
+# 1. Créez un compte gratuit sur https://formspree.io
+# 2. Créez un formulaire → copiez votre Form ID (ex: "xpwzgkdo")
+# 3. Collez-le ici ↓ ou exportez FORMSPREE_ID (laissez "" pour le fallback mailto)
+FORMSPREE_ID = os.environ.get("FORMSPREE_ID", "")   # ← ex: "xpwzgkdo"
+# Point d'envoi ; surchargeable pour tester contre un serveur HTTP local.
+FORMSPREE_URL = os.environ.get("FORMSPREE_URL", "https://formspree.io/f/{form_id}")
+# ──────────────────────────────────────────────────────────────────────────────
+
+# Délais (s) : établissement de la connexion / attente de la réponse.
+CONNECT_TIMEOUT = float(os.environ.get("FORMSPREE_CONNECT_TIMEOUT", "3.05"))
+READ_TIMEOUT = float(os.environ.get("FORMSPREE_READ_TIMEOUT", "10"))
+HTTP_POOL_SIZE = int(os.environ.get("FORMSPREE_POOL_SIZE", "4"))
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+OUTBOX_PATH = os.environ.get("PORTFOLIO_OUTBOX_PATH", os.path.join(BASE_DIR, "outbox.sqlite3"))
+OUTBOX_WORKERS = int(os.environ.get("PORTFOLIO_OUTBOX_WORKERS", "2"))
+
+# Anti-abus : RATE_BURST envois d'affilée par session et par email, puis un
+# toutes les RATE_REFILL secondes ; un message identique dans DEDUP_WINDOW
+# secondes n'est pas renvoyé.
+RATE_BURST = int(os.environ.get("PORTFOLIO_RATE_BURST", "3"))
+RATE_REFILL = float(os.environ.get("PORTFOLIO_RATE_REFILL", "120"))
+DEDUP_WINDOW = float(os.environ.get("PORTFOLIO_DEDUP_WINDOW", "600"))
+
+
+# ──────────────────────────────────────────────
+# SESSION HTTP PARTAGÉE
+# ──────────────────────────────────────────────
+class LatencyStats:
+    """Compteurs de latence des requêtes sortantes (thread-safe)."""
+
+    def __init__(self):
+        self.count = 0
+        self.errors = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.last = 0.0
+        self._lock = threading.Lock()
+
+    def record(self, seconds: float, error: bool = False) -> None:
+        with self._lock:
+            self.count += 1
+            self.errors += error
+            self.total += seconds
+            self.max = max(self.max, seconds)
+            self.last = seconds
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {
+                "requests": self.count,
+                "errors": self.errors,
+                "avg_ms": 1000 * self.total / self.count if self.count else 0.0,
+                "max_ms": 1000 * self.max,
+                "last_ms": 1000 * self.last,
+            }
+
+
+latency = LatencyStats()
+_session: requests.Session | None = None
+_session_lock = threading.Lock()
+
+
+def http_session() -> requests.Session:
+    """Session du processus : connexions keep-alive réutilisées entre les envois.
+
+    Seules les erreurs de connexion sont rejouées ici (la requête n'est alors
+    jamais partie, le POST peut être renvoyé sans risque de doublon) ; les
+    timeouts de lecture et les 5xx sont laissés à l'outbox.
+    """
+    global _session
+    with _session_lock:
+        if _session is None:
+            import requests
+            from requests.adapters import HTTPAdapter
+            from urllib3.util.retry import Retry
+
+            retry = Retry(total=2, connect=2, read=0, status=0, other=0, backoff_factor=0.3)
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=HTTP_POOL_SIZE, max_retries=retry)
+            session = requests.Session()
+            session.headers.update({"Accept": "application/json", "Connection": "keep-alive"})
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            _session = session
+        return _session
+
+
+def http_stats() -> dict:
+    """Latences et nombre de connexions réellement ouvertes par le pool."""
+    stats = latency.snapshot()
+    opened = 0
+    if _session is not None:
+        # Le même adaptateur est monté sur http:// et https:// : une fois chacun.
+        adapters = {id(a): a for a in _session.adapters.values()}.values()
+        for adapter in adapters:
+            for key in list(adapter.poolmanager.pools.keys()):
+                pool = adapter.poolmanager.pools.get(key)
+                opened += pool.num_connections if pool else 0
+    stats["connections_opened"] = opened
+    return stats
+
+
+def build_payload(name, email, subject, phone, message) -> dict:
+    return {
+        "name":    name,
+        "email":   email,
+        "phone":   phone or "non renseigné",
+        "_subject": subject,
+        "message": message,
+    }
+
+
+@metrics.timed("formspree.post")
+def post_to_formspree(form_id: str, payload: dict) -> tuple[bool, str, bool]:
+    """POST vers Formspree ; retourne (succès, erreur, erreur temporaire ?)."""
+    from requests import exceptions
+
+    url = FORMSPREE_URL.format(form_id=form_id)
+    start = time.perf_counter()
+    try:
+        r = http_session().post(url, data=payload, timeout=(CONNECT_TIMEOUT, READ_TIMEOUT))
+    except exceptions.Timeout:
+        latency.record(time.perf_counter() - start, error=True)
+        return False, "timeout", True
+    except exceptions.ConnectionError as exc:
+        latency.record(time.perf_counter() - start, error=True)
+        return False, str(exc), True
+    except Exception as exc:
+        latency.record(time.perf_counter() - start, error=True)
+        return False, str(exc), False
+    latency.record(time.perf_counter() - start, error=r.status_code != 200)
+    if r.status_code == 200:
+        return True, "ok", False
+    if r.status_code >= 500 or r.status_code == 429:
+        return False, f"Erreur HTTP {r.status_code}", True
+    try:
+        error = r.json().get("error", f"Erreur HTTP {r.status_code}")
+    except ValueError:
+        error = f"Erreur HTTP {r.status_code}"
+    return False, error, False
+
+
+def payload_fields(payload: dict) -> dict:
+    """Champs du formulaire d'un payload Formspree (inverse de ``build_payload``)."""
+    phone = payload.get("phone", "")
+    return {
+        "name": payload.get("name", ""),
+        "email": payload.get("email", ""),
+        "subject": payload.get("_subject", ""),
+        "phone": "" if phone == "non renseigné" else phone,
+        "message": payload.get("message", ""),
+    }
+
+
+def _deliver(job: dict) -> tuple[bool, str, bool]:
+    # Messages rejoués ou importés : mêmes règles que le formulaire.
+    try:
+        check(payload_fields(job["payload"]))
+    except ValidationError as exc:
+        metrics.incr("contact.invalid")
+        return False, f"Message invalide : {exc}", False
+    return post_to_formspree(job["form_id"], job["payload"])
+
+
+_outbox: Outbox | None = None
+_outbox_lock = threading.Lock()
+
+
+def get_outbox() -> Outbox:
+    """Outbox du processus, créée (et ses workers démarrés) au premier appel."""
+    global _outbox
+    with _outbox_lock:
+        if _outbox is None:
+            _outbox = Outbox(OUTBOX_PATH, _deliver, workers=OUTBOX_WORKERS)
+            _outbox.start()
+            metrics.register("outbox", _outbox.counts)
+        return _outbox
+
+
+limiter = RateLimiter(RATE_BURST, RATE_REFILL)
+dedup = Deduplicator(DEDUP_WINDOW)
+_queue_lock = threading.Lock()   # contrôle + écriture atomiques (double clic)
+
+
+def queue_message(name, email, subject, phone, message, form_id: str = "",
+                  session_id: str = "") -> int:
+    """Enregistre le message dans l'outbox ; l'envoi se fait en arrière-plan.
+
+    Les champs sont validés (``validation.check``, lève ``ValidationError``).
+    Un message identique déjà accepté récemment n'est pas remis en file (on
+    retourne son id) ; au-delà du débit autorisé pour la session ou l'email,
+    lève ``RateLimited``. Les deux contrôles précèdent toute écriture.
+    """
+    fields = check({"name": name, "email": email, "subject": subject,
+                    "phone": phone, "message": message})
+    name, email, subject, phone, message = (fields[k] for k in FIELDS)
+    fingerprint = dedup.fingerprint(name, email, subject, phone, message)
+    keys = [f"email:{email.strip().casefold()}"]
+    if session_id:
+        keys.append(f"session:{session_id}")
+    with _queue_lock:
+        previous = dedup.seen(fingerprint)
+        if previous is not None:
+            metrics.incr("contact.duplicate")
+            return previous
+        try:
+            limiter.acquire(*keys)
+        except RateLimited:
+            metrics.incr("contact.rate_limited")
+            raise
+
+        payload = build_payload(name, email, subject, phone, message)
+        msg_id = get_outbox().enqueue({"form_id": form_id or FORMSPREE_ID, "payload": payload})
+        dedup.remember(fingerprint, msg_id)
+    metrics.incr("contact.queued")
+    return msg_id
@@ -0,0 +1,223 @@
+"""Contenu du portfolio (statistiques, compétences, projets, parcours).
+
+Le contenu vit dans ``content.json``. Il est chargé une fois dans un modèle
+compact (dataclasses à ``__slots__``), validé au chargement, puis rechargé
+automatiquement quand le mtime du fichier change : modifier le contenu ne
+demande ni redéploiement ni redémarrage.
+"""
+import hashlib
+import json
+import logging
+import os
+import re
+import threading
+from dataclasses import dataclass
+
+logger = logging.getLogger(__name__)
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+CONTENT_PATH = os.environ.get("PORTFOLIO_CONTENT_PATH", os.path.join(BASE_DIR, "content.json"))
+
+_HEX_COLOR = re.compile(r"^[0-9A-Fa-f]{6}$")
+_SLUG = re.compile(r"^[a-z0-9]+$")
+
+
+class ContentError(ValueError):
+    """Fichier de contenu invalide."""
+
+
+@dataclass(frozen=True, slots=True)
+class HeroStat:
+    value: str
+    label: str
+
+
+@dataclass(frozen=True, slots=True)
+class Skill:
+    name: str
+    icon: str      # identifiant simpleicons.org
+    color: str     # couleur hexadécimale, sans '#'
+    level: int     # 0 – 100
+
+    @property
+    def logo_url(self) -> str:
+        return f"https://cdn.simpleicons.org/{self.icon}/{self.color}"
+
+
+@dataclass(frozen=True, slots=True)
+class SkillCategory:
+    title: str
+    items: tuple[Skill, ...]
+
+
+@dataclass(frozen=True, slots=True)
+class Project:
+    num: str
+    category: str
+    title: str
+    goal: str
+    description: str
+    tags: tuple[str, ...]
+    github_url: str
+    image_url: str
+    demo_url: str | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class Experience:
+    period: str
+    title: str
+    company: str
+    description: str
+
+
+@dataclass(frozen=True, slots=True)
+class Education:
+    period: str
+    title: str
+    school: str
+
+
+@dataclass(frozen=True, slots=True)
+class Content:
+    version: str
+    hero_stats: tuple[HeroStat, ...]
+    skills: tuple[SkillCategory, ...]
+    projects: tuple[Project, ...]
+    experience: tuple[Experience, ...]
+    education: tuple[Education, ...]
+
+
+# ──────────────────────────────────────────────
+# VALIDATION
+# ──────────────────────────────────────────────
+def _text(obj: dict, key: str, where: str, optional: bool = False) -> str | None:
+    value = obj.get(key)
+    if value is None and optional:
+        return None
+    if not isinstance(value, str) or not value.strip():
+        raise ContentError(f"{where}.{key} : texte non vide attendu")
+    return value
+
+
+def _list(obj: dict, key: str, where: str) -> list:
+    value = obj.get(key)
+    if not isinstance(value, list):
+        raise ContentError(f"{where}.{key} : liste attendue")
+    return value
+
+
+def _obj(value, where: str) -> dict:
+    if not isinstance(value, dict):
+        raise ContentError(f"{where} : objet attendu")
+    return value
+
+
+def _skill(raw, where: str) -> Skill:
+    raw = _obj(raw, where)
+    icon, color, level = _text(raw, "icon", where), _text(raw, "color", where), raw.get("level")
+    if not _SLUG.match(icon):
+        raise ContentError(f"{where}.icon : identifiant simpleicons invalide ({icon!r})")
+    if not _HEX_COLOR.match(color):
+        raise ContentError(f"{where}.color : couleur hexadécimale attendue ({color!r})")
+    if not isinstance(level, int) or isinstance(level, bool) or not 0 <= level <= 100:
+        raise ContentError(f"{where}.level : entier entre 0 et 100 attendu")
+    return Skill(_text(raw, "name", where), icon, color.upper(), level)
+
+
+def _project(raw, where: str) -> Project:
+    raw = _obj(raw, where)
+    tags = _list(raw, "tags", where)
+    if not all(isinstance(t, str) and t.strip() for t in tags):
+        raise ContentError(f"{where}.tags : liste de textes attendue")
+    return Project(
+        num=_text(raw, "num", where),
+        category=_text(raw, "category", where),
+        title=_text(raw, "title", where),
+        goal=_text(raw, "goal", where),
+        description=_text(raw, "description", where),
+        tags=tuple(tags),
+        github_url=_text(raw, "github_url", where),
+        image_url=_text(raw, "image_url", where),
+        demo_url=_text(raw, "demo_url", where, optional=True),
+    )
+
+
+def _category(raw, where: str) -> SkillCategory:
+    raw = _obj(raw, where)
+    items = _list(raw, "items", where)
+    return SkillCategory(
+        _text(raw, "title", where),
+        tuple(_skill(s, f"{where}.items[{j}]") for j, s in enumerate(items)),
+    )
+
+
+def _record(cls, raw, where: str, fields: tuple[str, ...]):
+    raw = _obj(raw, where)
+    return cls(*(_text(raw, k, where) for k in fields))
+
+
+def parse_content(data, version: str = "") -> Content:
+    """Construit et valide le modèle ; lève ContentError au premier défaut."""
+    data = _obj(data, "contenu")
+    hero = _obj(data.get("hero"), "hero")
+    return Content(
+        version=version,
+        hero_stats=tuple(
+            _record(HeroStat, s, f"hero.stats[{i}]", ("value", "label"))
+            for i, s in enumerate(_list(hero, "stats", "hero"))
+        ),
+        skills=tuple(
+            _category(c, f"skills[{i}]") for i, c in enumerate(_list(data, "skills", "contenu"))
+        ),
+        projects=tuple(
+            _project(p, f"projects[{i}]") for i, p in enumerate(_list(data, "projects", "contenu"))
+        ),
+        experience=tuple(
+            _record(Experience, e, f"experience[{i}]", ("period", "title", "company", "description"))
+            for i, e in enumerate(_list(data, "experience", "contenu"))
+        ),
+        education=tuple(
+            _record(Education, e, f"education[{i}]", ("period", "title", "school"))
+            for i, e in enumerate(_list(data, "education", "contenu"))
+        ),
+    )
+
+
+# ──────────────────────────────────────────────
+# CHARGEMENT + RECHARGEMENT À CHAUD
+# ──────────────────────────────────────────────
+_loaded: tuple[int, Content] | None = None
+_lock = threading.Lock()
+
+
+def load_content(path: str = CONTENT_PATH) -> Content:
+    """Modèle courant, relu seulement si le mtime du fichier a changé.
+
+    Si une nouvelle version du fichier est invalide, l'erreur est journalisée
+    et le dernier contenu valide continue d'être servi.
+    """
+    global _loaded
+    mtime = os.stat(path).st_mtime_ns
+    loaded = _loaded
+    if loaded and loaded[0] == mtime:
+        return loaded[1]
+    with _lock:
+        if _loaded and _loaded[0] == mtime:
+            return _loaded[1]
+        try:
+            with open(path, "rb") as f:
+                raw = f.read()
+            try:
+                data = json.loads(raw)
+            except ValueError as exc:
+                raise ContentError(f"JSON invalide : {exc}") from exc
+            content = parse_content(data, hashlib.sha256(raw).hexdigest()[:12])
+        except ContentError:
+            if _loaded is None:
+                raise
+            logger.exception("%s invalide, conservation de la version précédente", path)
+            _loaded = (mtime, _loaded[1])
+            return _loaded[1]
+        _loaded = (mtime, content)
+        return content
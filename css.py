@@ -0,0 +1,169 @@
+"""Outils CSS : minification, purge des sélecteurs inutilisés, CSS critique."""
+import re
+
+_COMMENT = re.compile(r"/\*.*?\*/", re.S)
+_SPACES = re.compile(r"\s+")
+_AROUND = re.compile(r"\s*([{};,>])\s*")
+_AFTER_COLON = re.compile(r":\s+")
+
+_CLASS_ATTR = re.compile(r'\bclass="([^"]*)"')
+_ID_ATTR = re.compile(r'\bid="([^"]*)"')
+# Pseudo-classes / pseudo-éléments et sélecteurs d'attribut, ignorés par la purge.
+_PSEUDO = re.compile(r"::?[\w-]+(\([^)]*\))?|\[[^\]]*\]")
+_TOKEN = re.compile(r"([.#])([\w-]+)")
+_KEYFRAMES = re.compile(r"@(?:-webkit-)?keyframes\s+([\w-]+)")
+_CONDITIONAL = ("@media", "@supports")
+
+# Règle : (prélude, corps) ; corps = déclarations, ou liste de règles pour
+# @media / @supports. Les @-règles sans bloc (@import) sont des chaînes.
+Rule = str | tuple[str, "str | list[Rule]"]
+
+
+def minify_css(css: str) -> str:
+    """Supprime commentaires et espaces superflus (sans toucher aux valeurs)."""
+    css = _COMMENT.sub("", css)
+    css = _SPACES.sub(" ", css)
+    css = _AROUND.sub(r"\1", css)
+    css = _AFTER_COLON.sub(":", css)
+    return css.replace(";}", "}").strip()
+
+
+# ──────────────────────────────────────────────
+# ANALYSE
+# ──────────────────────────────────────────────
+def parse_rules(css: str) -> list[Rule]:
+    """Découpe une feuille minifiée en règles de premier niveau."""
+    rules: list[Rule] = []
+    start = depth = 0
+    prelude_end = 0
+    quote = None
+    for i, ch in enumerate(css):
+        if quote:
+            if ch == quote:
+                quote = None
+        elif ch in "'\"":
+            quote = ch
+        elif ch == "{":
+            if depth == 0:
+                prelude_end = i
+            depth += 1
+        elif ch == "}":
+            depth -= 1
+            if depth == 0:
+                prelude = css[start:prelude_end].strip()
+                body = css[prelude_end + 1:i]
+                if prelude.startswith(_CONDITIONAL):
+                    body = parse_rules(body)
+                rules.append((prelude, body))
+                start = i + 1
+        elif ch == ";" and depth == 0:
+            rules.append(css[start:i + 1].strip())
+            start = i + 1
+    return rules
+
+
+def serialize(rules: list[Rule]) -> str:
+    out = []
+    for rule in rules:
+        if isinstance(rule, str):
+            out.append(rule)
+        else:
+            prelude, body = rule
+            out.append(f"{prelude}{{{serialize(body) if isinstance(body, list) else body}}}")
+    return "".join(out)
+
+
+def html_tokens(html: str) -> set[str]:
+    """Classes (``.x``) et identifiants (``#x``) présents dans le HTML."""
+    tokens = set()
+    for value in _CLASS_ATTR.findall(html):
+        tokens.update(f".{c}" for c in value.split())
+    tokens.update(f"#{i}" for i in _ID_ATTR.findall(html))
+    return tokens
+
+
+def selector_used(selector: str, tokens: set[str]) -> bool:
+    """Vrai si chaque classe / id du sélecteur existe dans le HTML.
+
+    Un sélecteur sans classe ni id (``html``, ``:root``, ``header``…) vise
+    la page entière et est toujours conservé.
+    """
+    needed = {"".join(m) for m in _TOKEN.findall(_PSEUDO.sub("", selector))}
+    return needed <= tokens
+
+
+# ──────────────────────────────────────────────
+# PURGE ET CSS CRITIQUE
+# ──────────────────────────────────────────────
+def _select(rules: list[Rule], tokens: set[str]) -> list[Rule]:
+    """Règles de style utilisées (sélecteurs inutiles retirés) ; sans @-règles à part."""
+    kept: list[Rule] = []
+    for rule in rules:
+        if isinstance(rule, str):
+            continue
+        prelude, body = rule
+        if isinstance(body, list):
+            inner = _select(body, tokens)
+            if inner:
+                kept.append((prelude, inner))
+        elif not prelude.startswith("@"):
+            selectors = [s for s in prelude.split(",") if selector_used(s, tokens)]
+            if selectors:
+                kept.append((",".join(selectors), body))
+    return kept
+
+
+def _subtract(rules: list[Rule], done: list[Rule]) -> list[Rule]:
+    """`rules` privé des règles déjà présentes dans `done`."""
+    out: list[Rule] = []
+    for rule in rules:
+        prelude, body = rule
+        if isinstance(body, list):
+            prev = next((b for p, b in done if p == prelude and isinstance(b, list)), [])
+            inner = _subtract(body, prev)
+            if inner:
+                out.append((prelude, inner))
+        elif rule not in done:
+            out.append(rule)
+    return out
+
+
+def _with_keyframes(rules: list[Rule], all_rules: list[Rule], skip: set[str]) -> list[Rule]:
+    """Ajoute les @keyframes référencées par `rules` (sauf celles de `skip`)."""
+    text = serialize(rules)
+    frames = []
+    for rule in all_rules:
+        if isinstance(rule, tuple) and (m := _KEYFRAMES.match(rule[0])):
+            name = m.group(1)
+            if name not in skip and re.search(rf"\b{re.escape(name)}\b", text):
+                frames.append(rule)
+    return rules + frames
+
+
+def purge_css(css: str, html: str, safelist: set[str] = frozenset()) -> str:
+    """Feuille minifiée réduite aux règles utilisées par `html`.
+
+    ``safelist`` : classes / ids (``.x`` / ``#x``) posés hors de ce HTML,
+    par exemple par Streamlit lui-même.
+    """
+    rules = parse_rules(minify_css(css))
+    globals_ = [r for r in rules if isinstance(r, str) or r[0].startswith("@font-face")]
+    used = _with_keyframes(_select(rules, html_tokens(html) | set(safelist)), rules, set())
+    return serialize(globals_ + used)
+
+
+def split_critical(css: str, html: str, above_fold: str,
+                   safelist: set[str] = frozenset()) -> tuple[str, str]:
+    """(CSS critique, reste) : le premier couvre `above_fold` (@import et
+    @font-face compris), le second le reste de `html`, sans doublon."""
+    rules = parse_rules(minify_css(css))
+    tokens = set(safelist)
+    globals_ = [r for r in rules if isinstance(r, str) or r[0].startswith("@font-face")]
+    critical = _select(rules, html_tokens(above_fold) | tokens)
+    rest = _subtract(_select(rules, html_tokens(html) | tokens), critical)
+    critical_frames = _with_keyframes(critical, rules, set())[len(critical):]
+    skip = {_KEYFRAMES.match(r[0]).group(1) for r in critical_frames}
+    return (
+        serialize(globals_ + critical + critical_frames),
+        serialize(_with_keyframes(rest, rules, skip)),
+    )
@@ -0,0 +1,178 @@
+"""Export du portfolio en site statique (un fichier HTML par page).
+
+    python export.py [--out dist] [--app-url https://mon-app.streamlit.app]
+
+Les pages sont produites par les mêmes fonctions que l'app Streamlit. Le
+dossier obtenu (HTML, CSS minifié et haché, images déclinées, CV) peut être
+servi tel quel par nginx ou un CDN (variantes ``.gz`` / ``.br`` comprises,
+voir ``compress.py``) ; seul le formulaire de contact a encore
+besoin de l'app Streamlit (``--app-url``).
+"""
+import argparse
+import hashlib
+import os
+import re
+import shutil
+
+from assets import STATIC_DIR, STATIC_URL, publish
+from compress import precompress_tree
+from content import load_content
+from css import purge_css
+from fragments import STATIC_PAGES, page_html, page_markup
+from images import profile_photo
+from loaders import cv_locator, read_text
+from static_pages import (
+    FOOTER_HTML, PAGES, contact_html, home_html, nav_html, photo_block_html,
+)
+from vendor import localize_css
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+ASSETS = "assets"
+
+_PAGE_LINK = re.compile(r'href="\?page=(\w+)"')
+_ASSET_REF = re.compile(rf'{ASSETS}/([^"?\s,]+)')
+
+DOCUMENT = """<!DOCTYPE html>
+<html lang="fr">
+<head>
+<meta charset="utf-8">
+<meta name="viewport" content="width=device-width, initial-scale=1">
+<title>{title}</title>
+{preloads}<link rel="stylesheet" href="{css_href}">
+</head>
+<body>
+<div class="pf-root">
+{nav}
+{body}
+{footer}
+</div>
+</body>
+</html>
+"""
+
+
+def page_filename(page: str) -> str:
+    return "index.html" if page == "home" else f"{page}.html"
+
+
+def rewrite_links(html: str) -> str:
+    """``?page=xxx`` → ``xxx.html`` (``index.html`` pour l'accueil)."""
+    return _PAGE_LINK.sub(lambda m: f'href="{page_filename(m.group(1))}"', html)
+
+
+def export_css(out_dir: str, markup: str) -> tuple[str, list[str]]:
+    """Écrit la feuille de style, purgée des règles absentes de `markup` ;
+    retourne son URL et celles des polices locales."""
+    fonts = []
+
+    def font_url(path: str) -> str | None:
+        # Police copiée à côté de la feuille de style : URL relative nue.
+        published = publish(path)
+        if published is None:
+            return None
+        shutil.copyfile(os.path.join(STATIC_DIR, published[0]),
+                        os.path.join(out_dir, ASSETS, published[0]))
+        fonts.append(f"{ASSETS}/{published[0]}")
+        return published[0]
+
+    css = read_text(os.path.join(BASE_DIR, "style.css")) or ""
+    css = purge_css(localize_css(css, url_for=font_url), markup)
+    digest = hashlib.sha256(css.encode()).hexdigest()[:12]
+    name = f"style.{digest}.css"
+    with open(os.path.join(out_dir, ASSETS, name), "w", encoding="utf-8") as f:
+        f.write(css)
+    return f"{ASSETS}/{name}", fonts
+
+
+def home_body() -> str:
+    body = home_html(load_content(), photo_block_html(
+        profile_photo(os.path.join(BASE_DIR, "My_Photo.jpeg"), url_prefix=ASSETS)
+    ))
+    cv_path = cv_locator.find()
+    published = publish(cv_path) if cv_path else None
+    if published:
+        name = os.path.basename(cv_path)
+        body += (
+            '\n<div class="section-inner">'
+            f'<a class="btn-primary" href="{ASSETS}/{published[0]}" download="{name}">'
+            "📄 Télécharger mon CV</a></div>"
+        )
+    return body
+
+
+def contact_body(app_url: str | None) -> str:
+    if app_url:
+        href = f"{app_url.rstrip('/')}/?page=contact"
+        label = "📨 Ouvrir le formulaire"
+    else:
+        href = "mailto:enjipang@gmail.com"
+        label = "📨 Écrire un email"
+    return contact_html() + (
+        '\n<div style="max-width:1080px; margin: 0 auto; padding: 0 3rem 4rem;">'
+        f'<a class="btn-primary" href="{href}">{label}</a></div>'
+    )
+
+
+def export_site(out_dir: str, app_url: str | None = None) -> list[str]:
+    """Écrit le site dans `out_dir` et retourne la liste des fichiers produits."""
+    if os.path.isdir(out_dir) and os.listdir(out_dir):
+        # On n'écrase qu'un export précédent, jamais un dossier quelconque.
+        if not os.path.isfile(os.path.join(out_dir, "index.html")):
+            raise SystemExit(f"{out_dir} n'est pas vide et ne ressemble pas à un export.")
+        shutil.rmtree(out_dir)
+    os.makedirs(os.path.join(out_dir, ASSETS))
+
+    markup = DOCUMENT + "".join(page_markup(page) for page in PAGES.values())
+    css_href, fonts = export_css(out_dir, markup + home_body() + contact_body(app_url))
+    preloads = "".join(
+        f'<link rel="preload" href="{href}" as="font" type="font/woff2" crossorigin>\n'
+        for href in fonts
+    )
+    titles = {key: label.split(" ", 1)[1] for label, key in PAGES.items()}
+    written = [css_href, *fonts]
+    for page in PAGES.values():
+        if page == "home":
+            body = home_body()
+        elif page == "contact":
+            body = contact_body(app_url)
+        elif page in STATIC_PAGES:
+            body = page_html(page)
+        else:
+            continue
+        html = DOCUMENT.format(
+            title=f"{titles[page]} — NJIPANG DONGMO Eraste",
+            preloads=preloads,
+            css_href=css_href,
+            nav=nav_html(page),
+            body=body,
+            footer=FOOTER_HTML,
+        )
+        # Fichiers servis par l'app (icônes vendorisées…) → dossier assets/.
+        html = rewrite_links(html).replace(f"{STATIC_URL}/", f"{ASSETS}/")
+        for ref in set(_ASSET_REF.findall(html)):
+            src = os.path.join(STATIC_DIR, ref)
+            if os.path.isfile(src):
+                shutil.copyfile(src, os.path.join(out_dir, ASSETS, ref))
+                written.append(f"{ASSETS}/{ref}")
+        filename = page_filename(page)
+        with open(os.path.join(out_dir, filename), "w", encoding="utf-8") as f:
+            f.write(html)
+        written.append(filename)
+    # Variantes .gz / .br servies directement par nginx ou le CDN.
+    written += [os.path.relpath(p, out_dir) for p in precompress_tree(out_dir)]
+    return sorted(set(written))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Exporte le portfolio en site statique.")
+    parser.add_argument("--out", default=os.path.join(BASE_DIR, "dist"),
+                        help="dossier de sortie (écrasé), par défaut ./dist")
+    parser.add_argument("--app-url", default=None,
+                        help="URL de l'app Streamlit pour le formulaire de contact")
+    args = parser.parse_args()
+    for path in export_site(args.out, args.app_url):
+        print(os.path.join(args.out, path))
+
+
+if __name__ == "__main__":
+    main()
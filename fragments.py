@@ -0,0 +1,154 @@
+"""Cache des fragments HTML, partagé par toutes les sessions du processus.
+
+Une page statique est construite une fois par version de contenu ; les rendus
+suivants se résument à une lecture de dictionnaire.
+"""
+import hashlib
+import threading
+from typing import Callable, Iterable
+
+import metrics
+import static_pages
+import vendor
+from content import load_content
+from css import split_critical
+
+
+class FragmentCache:
+    """Fragments HTML indexés par (clé, version de contenu)."""
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self._entries: dict[str, tuple[str, str]] = {}
+        # Réentrant : un fragment (CSS d'une page) peut dépendre d'un autre.
+        self._lock = threading.RLock()
+
+    def get(self, key: str, version: str, build: Callable[[], str]) -> str:
+        entry = self._entries.get(key)
+        if entry and entry[0] == version:
+            self.hits += 1
+            return entry[1]
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry and entry[0] == version:
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+            html = build()
+            self._entries[key] = (version, html)
+            return html
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "bytes": sum(len(html) for _, html in self._entries.values()),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": self.hits / lookups if lookups else 0.0,
+        }
+
+
+fragment_cache = FragmentCache()
+STATIC_PAGES = frozenset(static_pages.BUILDERS)
+
+
+def page_html(page: str, local_assets: bool = True) -> str:
+    """HTML (mis en cache) d'une page statique, reconstruit si le contenu change.
+
+    ``local_assets`` : logos et images des projets servis depuis vendor/
+    (serveur statique actif) plutôt que depuis le CDN.
+    """
+    content = load_content()
+    build = static_pages.BUILDERS[page]
+    if page == "skills" and local_assets:
+        build = lambda c: static_pages.skills_html(c, icon_url=vendor.icon_url)  # noqa: E731
+    elif page == "projects" and local_assets:
+        build = lambda c: static_pages.projects_html(c, image_html=vendor.project_image)  # noqa: E731
+    assets_version = vendor.version() if local_assets else "cdn"
+    version = f"{static_pages.TEMPLATE_VERSION}:{content.version}:{assets_version}"
+
+    def timed_build() -> str:
+        with metrics.Timer(f"build.{page}"):
+            return build(content)
+
+    return fragment_cache.get(f"{page}:{int(local_assets)}", version, timed_build)
+
+
+_warmed = False
+
+
+def warm_up(pages: Iterable[str], local_assets: bool = True) -> None:
+    """Pré-rend, une seule fois par processus, les pages statiques listées."""
+    global _warmed
+    if _warmed:
+        return
+    for page in pages:
+        if page in STATIC_PAGES:
+            page_html(page, local_assets)
+    _warmed = True
+
+
+# ──────────────────────────────────────────────
+# CSS PAR PAGE
+# ──────────────────────────────────────────────
+# Sélecteurs de style.css qui visent le DOM de Streamlit, pas nos gabarits.
+STREAMLIT_SAFELIST = frozenset({"#MainMenu", ".block-container", ".stApp"})
+# Début du HTML de la page considéré comme visible sans défilement.
+ABOVE_FOLD_CHARS = 1500
+# Balises posées par portfolio.py hors des gabarits, par page.
+EXTRA_MARKUP = {
+    "home": (
+        static_pages.photo_block_html(None)
+        + static_pages.photo_block_html(("<img>", '<img class="lightbox-content">'))
+        + '<a class="btn-primary cv-download"></a>'
+    ),
+}
+
+
+def page_markup(page: str, local_assets: bool = True) -> str:
+    """Tout le HTML qu'une page peut afficher (base de la purge CSS)."""
+    if page == "home":
+        body = static_pages.home_html(load_content(), "")
+    elif page == "contact":
+        body = static_pages.contact_html()
+    else:
+        body = page_html(page, local_assets)
+    return static_pages.nav_html(page) + body + EXTRA_MARKUP.get(page, "") + static_pages.FOOTER_HTML
+
+
+def page_styles(page: str, css: str, local_assets: bool = True,
+                safelist: frozenset[str] = STREAMLIT_SAFELIST) -> tuple[str, str]:
+    """(CSS critique, reste) de la page, calculés une fois par feuille de style.
+
+    Le critique couvre la navigation et le haut de la page ; le reste est
+    injecté après le contenu.
+    """
+    digest = hashlib.sha256(css.encode()).hexdigest()[:12]
+    content = load_content()
+    version = f"{static_pages.TEMPLATE_VERSION}:{content.version}:{digest}"
+    key = f"css:{page}:{int(local_assets)}:{','.join(sorted(safelist))}"
+
+    @metrics.timed(f"css.{page}")
+    def build() -> str:
+        markup = page_markup(page, local_assets)
+        critical, rest = split_critical(css, markup, markup[:ABOVE_FOLD_CHARS], safelist)
+        return f"{critical}\0{rest}"
+
+    critical, rest = fragment_cache.get(key, version, build).split("\0")
+    return critical, rest
+
+
+# ──────────────────────────────────────────────
+# NAVIGATION
+# ──────────────────────────────────────────────
+def nav(page: str) -> str:
+    """Barre de navigation (lien actif = `page`), construite une fois par page."""
+    return fragment_cache.get(
+        f"nav:{page}", static_pages.TEMPLATE_VERSION, lambda: static_pages.nav_html(page)
+    )
@@ -0,0 +1,198 @@
+"""Déclinaisons responsives d'images (vignette, lightbox…) générées avec Pillow.
+
+Chaque déclinaison est écrite une seule fois dans ``static/`` sous un nom qui
+contient l'empreinte du fichier source : tant que la source ne change pas, les
+fichiers générés sont réutilisés, y compris d'un processus à l'autre.
+"""
+import html
+import os
+import threading
+
+from PIL import Image, ImageOps, features
+
+from assets import STATIC_DIR, STATIC_URL, atomic_path, file_digest, publish
+
+# format -> (extension, type MIME, options d'encodage Pillow)
+FORMATS = {
+    "avif": ("avif", "image/avif", {"quality": 55}),
+    "webp": ("webp", "image/webp", {"quality": 80, "method": 6}),
+    "jpeg": ("jpg", "image/jpeg", {"quality": 82, "optimize": True, "progressive": True}),
+}
+# Formats modernes proposés en <source>, du plus compact au moins compact ;
+# le JPEG reste la valeur de repli de <img>.
+MODERN_FORMATS = [f for f in ("avif", "webp") if features.check(f)]
+
+# chemin absolu -> (mtime_ns, taille, empreinte, (largeur, hauteur))
+_sources: dict[str, tuple[int, int, str, tuple[int, int]]] = {}
+_lock = threading.Lock()
+
+
+def _source_info(path: str) -> tuple[str, tuple[int, int]] | None:
+    """Empreinte et dimensions de l'image source, recalculées si son mtime change."""
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None
+    hit = _sources.get(path)
+    if hit and hit[0] == st.st_mtime_ns and hit[1] == st.st_size:
+        return hit[2], hit[3]
+    with Image.open(path) as img:
+        size = ImageOps.exif_transpose(img).size
+    digest = file_digest(path)
+    _sources[path] = (st.st_mtime_ns, st.st_size, digest, size)
+    return digest, size
+
+
+def _target_size(src_size: tuple[int, int], width: int,
+                 aspect: float | None) -> tuple[int, int]:
+    src_w, src_h = src_size
+    if aspect:
+        width = min(width, src_w, round(src_h * aspect))
+        return width, round(width / aspect)
+    width = min(width, src_w)
+    return width, round(src_h * width / src_w)
+
+
+def derive(path: str, width: int, fmt: str, square: bool = False,
+           aspect: float | None = None) -> tuple[str, int, int] | None:
+    """Génère (ou réutilise) une déclinaison et retourne (nom, largeur, hauteur).
+
+    ``square`` (ou ``aspect``, rapport largeur / hauteur) recadre au centre ;
+    sinon l'image est redimensionnée en conservant ses proportions, sans
+    jamais l'agrandir. Une déclinaison aux dimensions de la source qui n'est
+    pas plus légère qu'elle cède la place à l'original publié.
+    """
+    if square:
+        aspect = 1.0
+    path = os.path.abspath(path)
+    with _lock:
+        info = _source_info(path)
+        if info is None:
+            return None
+        digest, src_size = info
+        w, h = _target_size(src_size, width, aspect)
+        ext, _, options = FORMATS[fmt]
+        stem = os.path.splitext(os.path.basename(path))[0]
+        name = f"{stem}-{w}x{h}.{digest}.{ext}"
+        dest = os.path.join(STATIC_DIR, name)
+        if not os.path.isfile(dest):
+            with Image.open(path) as img:
+                img = ImageOps.exif_transpose(img).convert("RGB")
+                if aspect:
+                    img = ImageOps.fit(img, (w, h), Image.LANCZOS)
+                else:
+                    img = img.resize((w, h), Image.LANCZOS)
+                os.makedirs(STATIC_DIR, exist_ok=True)
+                with atomic_path(dest) as tmp:
+                    img.save(tmp, format=fmt.upper(), **options)
+        # Simple ré-encodage (pas de réduction) : garder la plus légère. La
+        # déclinaison reste sur disque, la comparaison ne coûte qu'un stat.
+        if (w, h) == src_size and os.path.getsize(dest) >= os.path.getsize(path):
+            published = publish(path)
+            if published:
+                return published[0], w, h
+        return name, w, h
+
+
+def _srcset(path: str, widths: tuple[int, ...], fmt: str, square: bool,
+            url_prefix: str) -> tuple[str, int, int] | None:
+    entries, last = [], None
+    for width in widths:
+        last = derive(path, width, fmt, square)
+        if last is None:
+            return None
+        name, w, _ = last
+        digest = name.rsplit(".", 2)[1]
+        entry = f"{url_prefix}/{name}?v={digest} {w}w"
+        if entry not in entries:
+            entries.append(entry)
+    return ", ".join(entries), last[1], last[2]
+
+
+def picture_html(
+    path: str,
+    widths: tuple[int, ...],
+    sizes: str,
+    square: bool = False,
+    alt: str = "",
+    css_class: str = "",
+    lazy: bool = False,
+    url_prefix: str = STATIC_URL,
+) -> str | None:
+    """Balise <picture> (AVIF/WebP + repli JPEG) avec srcset, ou None si
+    l'image source n'existe pas ou ne peut pas être décodée.
+
+    Les fichiers sont toujours générés dans static/ ; ``url_prefix`` ne change
+    que les URL émises (export statique).
+    """
+    try:
+        jpeg = _srcset(path, widths, "jpeg", square, url_prefix)
+        if jpeg is None:
+            return None
+        sources = ""
+        for fmt in MODERN_FORMATS:
+            srcset, _, _ = _srcset(path, widths, fmt, square, url_prefix)
+            sources += f'<source type="{FORMATS[fmt][1]}" srcset="{srcset}" sizes="{sizes}">'
+    except OSError:
+        return None
+
+    srcset, w, h = jpeg
+    fallback = srcset.rsplit(", ", 1)[-1].rsplit(" ", 1)[0]
+    attrs = f' class="{css_class}"' if css_class else ""
+    attrs += ' loading="lazy"' if lazy else ""
+    return (
+        f"<picture>{sources}"
+        f'<img src="{fallback}" srcset="{srcset}" sizes="{sizes}" '
+        f'width="{w}" height="{h}" alt="{html.escape(alt)}"{attrs}>'
+        f"</picture>"
+    )
+
+
+# ──────────────────────────────────────────────
+# PHOTO DE PROFIL
+# ──────────────────────────────────────────────
+PHOTO_ALT = "NJIPANG DONGMO Eraste"
+PHOTO_THUMB_WIDTHS = (140, 280)     # .profile-circle : 140px, 1x / 2x
+PHOTO_LIGHTBOX_WIDTHS = (480, 1080)  # .photo-lightbox : plafonné à 1080px
+
+
+def profile_photo(path: str, url_prefix: str = STATIC_URL) -> tuple[str, str] | None:
+    """Balises (vignette, lightbox) de la photo de profil."""
+    thumb = picture_html(path, PHOTO_THUMB_WIDTHS, "140px", square=True,
+                         alt=PHOTO_ALT, url_prefix=url_prefix)
+    full = picture_html(path, PHOTO_LIGHTBOX_WIDTHS, "90vw", alt=PHOTO_ALT,
+                        css_class="lightbox-content", lazy=True, url_prefix=url_prefix)
+    return (thumb, full) if thumb and full else None
+
+
+# ──────────────────────────────────────────────
+# IMAGES DES PROJETS
+# ──────────────────────────────────────────────
+CARD_FORMAT = "webp" if "webp" in MODERN_FORMATS else "jpeg"
+
+
+def card_image(path: str, size: tuple[int, int], alt: str = "", css_class: str = "",
+               url_prefix: str = STATIC_URL) -> str | None:
+    """<img> recadrée aux dimensions de la carte (1x et 2x), en WebP, chargée
+    paresseusement ; None si l'image source est absente ou illisible."""
+    width, height = size
+    urls = []
+    try:
+        for density in (1, 2):
+            derived = derive(path, width * density, CARD_FORMAT, aspect=width / height)
+            if derived is None:
+                return None
+            name = derived[0]
+            url = f"{url_prefix}/{name}?v={name.rsplit('.', 2)[1]}"
+            if url not in urls:  # source trop petite pour le 2x
+                urls.append(url)
+    except OSError:
+        return None
+
+    srcset = ", ".join(f"{url} {i}x" for i, url in enumerate(urls, 1))
+    attrs = f' class="{css_class}"' if css_class else ""
+    return (
+        f'<img src="{urls[0]}" srcset="{srcset}" '
+        f'width="{width}" height="{height}" alt="{html.escape(alt)}"{attrs} '
+        f'loading="lazy" decoding="async">'
+    )
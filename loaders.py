@@ -0,0 +1,156 @@
+"""Cache mémoire partagé (par processus) pour les fichiers lus par l'app.
+
+Toutes les sessions Streamlit partagent la même instance : un fichier n'est lu
+sur disque qu'une fois, puis resservi depuis la mémoire tant que son mtime et
+sa taille n'ont pas changé. Le cache est borné en octets (éviction LRU).
+"""
+import os
+import threading
+from collections import OrderedDict
+
+DEFAULT_MAX_BYTES = 8 * 1024 * 1024
+
+
+class FileCache:
+    """Cache LRU de contenus de fichiers, invalidé par (mtime, taille)."""
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: OrderedDict[str, tuple[int, int, bytes]] = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def read(self, path: str) -> bytes | None:
+        """Contenu du fichier, ou None s'il n'existe pas."""
+        path = os.path.abspath(path)
+        try:
+            st = os.stat(path)
+        except FileNotFoundError:
+            self.discard(path)
+            return None
+
+        with self._lock:
+            entry = self._entries.get(path)
+            if entry and entry[0] == st.st_mtime_ns and entry[1] == st.st_size:
+                self._entries.move_to_end(path)
+                self.hits += 1
+                return entry[2]
+            self.misses += 1
+
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+        except FileNotFoundError:
+            self.discard(path)
+            return None
+
+        with self._lock:
+            self._drop(path)
+            if len(data) <= self.max_bytes:
+                self._entries[path] = (st.st_mtime_ns, st.st_size, data)
+                self._size += len(data)
+                while self._size > self.max_bytes:
+                    _, (_, _, old) = self._entries.popitem(last=False)
+                    self._size -= len(old)
+                    self.evictions += 1
+        return data
+
+    def discard(self, path: str) -> None:
+        with self._lock:
+            self._drop(os.path.abspath(path))
+
+    def _drop(self, path: str) -> None:
+        entry = self._entries.pop(path, None)
+        if entry:
+            self._size -= len(entry[2])
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "bytes": self._size,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_ratio": self.hits / lookups if lookups else 0.0,
+            }
+
+
+file_cache = FileCache(int(os.environ.get("PORTFOLIO_FILE_CACHE_BYTES", DEFAULT_MAX_BYTES)))
+
+
+def read_bytes(path: str) -> bytes | None:
+    return file_cache.read(path)
+
+
+def read_text(path: str, encoding: str = "utf-8") -> str | None:
+    data = file_cache.read(path)
+    return data.decode(encoding) if data is not None else None
+
+
+# ──────────────────────────────────────────────
+# LOCALISATION DU CV
+# ──────────────────────────────────────────────
+CV_PATH_ENV = "PORTFOLIO_CV_PATH"
+CV_CANDIDATES = [
+    "CV_NJIPANG_Eraste.pdf", "CV_NJIPANG_Eraste.PDF",
+    "CV_Eraste2.pdf", "CV_Eraste.pdf", "CV.pdf", "MonCV.pdf",
+]
+CV_KEYWORDS = ("cv", "eraste", "njipang", "curriculum")
+
+
+def scan_cv_dir(base_dir: str) -> str | None:
+    """Recherche complète du CV dans `base_dir` (noms connus, puis mots-clés)."""
+    for c in CV_CANDIDATES:
+        p = os.path.join(base_dir, c)
+        if os.path.isfile(p):
+            return p
+    for f in sorted(os.listdir(base_dir)):
+        lf = f.lower()
+        if lf.endswith(".pdf") and any(k in lf for k in CV_KEYWORDS):
+            return os.path.join(base_dir, f)
+    return None
+
+
+class CVLocator:
+    """Trouve le CV une fois, puis ne refait le scan que si le dossier change.
+
+    Ajouter, supprimer ou renommer un fichier modifie le mtime du dossier :
+    un seul ``os.stat`` par appel suffit donc à savoir si le résultat est
+    encore valable. Un chemin explicite (argument ou ``PORTFOLIO_CV_PATH``)
+    court-circuite toute recherche.
+    """
+
+    def __init__(self, base_dir: str, configured_path: str | None = None):
+        self.base_dir = base_dir
+        self.configured_path = configured_path or os.environ.get(CV_PATH_ENV) or None
+        self.scans = 0
+        self._dir_mtime: int | None = None
+        self._result: str | None = None
+        self._lock = threading.Lock()
+
+    def find(self) -> str | None:
+        if self.configured_path:
+            return self.configured_path if os.path.isfile(self.configured_path) else None
+        try:
+            mtime = os.stat(self.base_dir).st_mtime_ns
+        except FileNotFoundError:
+            return None
+        with self._lock:
+            if mtime != self._dir_mtime:
+                self._result = scan_cv_dir(self.base_dir)
+                self._dir_mtime = mtime
+                self.scans += 1
+            return self._result
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._dir_mtime = None
+
+
+cv_locator = CVLocator(os.path.dirname(os.path.abspath(__file__)))
@@ -0,0 +1,340 @@
+"""Test de charge : N sessions websocket simultanées contre un serveur local.
+
+    python loadtest.py [--sessions 20] [--rounds 3] [--pages home about ...]
+                       [--submit-every 5] [--port 8599] [--json rapport.json]
+
+Le script lance ``streamlit run portfolio.py`` (Formspree remplacé par le
+serveur local de ``bench_render.py``), puis ouvre ``--sessions`` connexions
+``/_stcore/stream`` qui parlent le protocole du navigateur (protobufs
+``BackMsg`` / ``ForwardMsg``) : chaque session parcourt les pages via
+``?page=`` et, une fois sur ``--submit-every``, envoie le formulaire de
+contact.
+
+Rapport : latence de rendu p50 / p95 / p99 (de l'envoi de la requête au
+``script_finished``), débit en rendus par seconde, RSS du serveur (au repos,
+au pic, par session) et nombre de messages reçus par le faux Formspree.
+
+Dépendances : ``pip install -r requirements-dev.txt`` (client websocket).
+"""
+import argparse
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import threading
+import time
+import urllib.request
+import uuid
+
+from bench_render import _FormspreeStub, start_formspree_stub
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_PAGES = ["home", "about", "skills", "projects", "experience", "contact"]
+
+
+def contact_values(tag: str, n: int) -> dict[str, str]:
+    """Formulaire de l'envoi `n` de la session `tag` : email propre à la
+    session et message unique, pour que la déduplication ne court-circuite
+    pas l'outbox."""
+    return {
+        "contact_name": "Charge",
+        "contact_email": f"charge+{tag}@example.com",
+        "contact_subject": "Test de charge",
+        "contact_phone": "",
+        "contact_message": f"Message n°{n} envoyé par le test de charge ({tag}).",
+    }
+
+
+# ──────────────────────────────────────────────
+# SERVEUR
+# ──────────────────────────────────────────────
+def launch_server(port: int) -> subprocess.Popen:
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "streamlit", "run", "portfolio.py",
+         "--server.port", str(port), "--server.headless", "true",
+         "--browser.gatherUsageStats", "false"],
+        cwd=BASE_DIR, env=os.environ.copy(),
+        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    deadline = time.time() + 60
+    while time.time() < deadline:
+        try:
+            with urllib.request.urlopen(f"http://127.0.0.1:{port}/_stcore/health", timeout=1):
+                return proc
+        except OSError:
+            if proc.poll() is not None:
+                raise SystemExit("Le serveur Streamlit s'est arrêté au démarrage.")
+            time.sleep(0.3)
+    proc.terminate()
+    raise SystemExit("Le serveur Streamlit ne répond pas.")
+
+
+def rss_bytes(pid: int) -> int | None:
+    """RSS du processus (Linux, /proc) ; None ailleurs."""
+    try:
+        with open(f"/proc/{pid}/status", encoding="ascii") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        return None
+    return None
+
+
+class RSSSampler(threading.Thread):
+    """Relève le RSS du serveur à intervalle régulier et garde le pic."""
+
+    def __init__(self, pid: int, interval: float = 0.2):
+        super().__init__(daemon=True)
+        self.pid = pid
+        self.interval = interval
+        self.peak = 0
+        self._done = threading.Event()
+
+    def run(self) -> None:
+        while not self._done.is_set():
+            self.peak = max(self.peak, rss_bytes(self.pid) or 0)
+            self._done.wait(self.interval)
+
+    def stop(self) -> None:
+        self._done.set()
+        self.join()
+
+
+# ──────────────────────────────────────────────
+# SESSION NAVIGATEUR SIMULÉE
+# ──────────────────────────────────────────────
+class Session:
+    """Une connexion websocket qui se comporte comme un onglet du navigateur."""
+
+    def __init__(self, url: str, compression: str | None = "deflate"):
+        self.url = url
+        self.compression = compression      # None : pas de permessage-deflate
+        self.ws = None
+        self.widgets: dict[str, str] = {}   # clé utilisateur -> id Streamlit
+        self.submit_id: str | None = None   # bouton d'envoi du formulaire
+        self.reset_id: str | None = None    # « Envoyer un autre message »
+        self.fragment_id = ""
+        self.tag = uuid.uuid4().hex[:8]
+        self.submitted = 0
+
+    async def __aenter__(self) -> "Session":
+        import websockets
+
+        self.ws = await websockets.connect(self.url, subprotocols=["streamlit"], max_size=None,
+                                           compression=self.compression)
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        await self.ws.close()
+
+    async def rerun(self, page: str, widget_states=None, fragment_id: str = "") -> dict:
+        """Demande un rendu et attend ``script_finished`` ; retourne les mesures."""
+        from streamlit.proto.BackMsg_pb2 import BackMsg
+        from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+
+        msg = BackMsg()
+        msg.rerun_script.query_string = f"page={page}"
+        if fragment_id:
+            msg.rerun_script.fragment_id = fragment_id
+        if widget_states:
+            msg.rerun_script.widget_states.widgets.extend(widget_states)
+
+        self.submit_id = self.reset_id = None
+        start = time.perf_counter()
+        await self.ws.send(msg.SerializeToString())
+        received = 0
+        alerts, errors = [], []
+        while True:
+            raw = await self.ws.recv()
+            received += len(raw)
+            fwd = ForwardMsg()
+            fwd.ParseFromString(raw)
+            kind = fwd.WhichOneof("type")
+            if kind == "delta" and fwd.delta.WhichOneof("type") == "new_element":
+                self._collect(fwd.delta, alerts, errors)
+            elif kind == "script_finished":
+                status = fwd.script_finished
+                if status == ForwardMsg.FINISHED_EARLY_FOR_RERUN:
+                    continue
+                if status == ForwardMsg.FINISHED_WITH_COMPILE_ERROR:
+                    errors.append("compile error")
+                break
+        return {
+            "latency": time.perf_counter() - start,
+            "bytes": received,
+            "alerts": alerts,
+            "errors": errors,
+        }
+
+    def _collect(self, delta, alerts: list, errors: list) -> None:
+        element = delta.new_element
+        kind = element.WhichOneof("type")
+        if kind == "exception":
+            errors.append(element.exception.message)
+        elif kind == "alert":
+            alerts.append(element.alert.body)
+        elif kind in ("text_input", "text_area"):
+            widget = getattr(element, kind)
+            key = widget.id.rsplit("-", 1)[-1]
+            self.widgets[key] = widget.id
+            self.fragment_id = delta.fragment_id
+        elif kind == "button":
+            if element.button.is_form_submitter:
+                self.submit_id = element.button.id
+            else:
+                self.reset_id = element.button.id
+            self.fragment_id = delta.fragment_id
+
+    async def submit_contact(self) -> dict:
+        from streamlit.proto.WidgetStates_pb2 import WidgetState
+
+        if not (self.submit_id or self.reset_id):
+            await self.rerun("contact")
+        if self.reset_id:  # message précédent envoyé : retour au formulaire
+            reset = WidgetState(id=self.reset_id, trigger_value=True)
+            await self.rerun("contact", [reset], self.fragment_id)
+        if not self.submit_id:
+            return {"latency": 0.0, "bytes": 0, "alerts": [],
+                    "errors": ["formulaire introuvable"]}
+        self.submitted += 1
+        states = []
+        for key, value in contact_values(self.tag, self.submitted).items():
+            states.append(WidgetState(id=self.widgets[key], string_value=value))
+        states.append(WidgetState(id=self.submit_id, trigger_value=True))
+        result = await self.rerun("contact", states, self.fragment_id)
+        if not any("Message bien reçu" in a for a in result["alerts"]):
+            result["errors"].append("formulaire refusé : " + " / ".join(result["alerts"]))
+        return result
+
+
+async def visitor(url: str, index: int, pages: list[str], rounds: int,
+                  submit_every: int, samples: list) -> None:
+    async with Session(url) as session:
+        for _ in range(rounds):
+            for page in pages:
+                result = await session.rerun(page)
+                samples.append((page, result))
+                if page == "contact" and submit_every and index % submit_every == 0:
+                    samples.append(("contact:submit", await session.submit_contact()))
+
+
+# ──────────────────────────────────────────────
+# RAPPORT
+# ──────────────────────────────────────────────
+def percentile(values: list[float], q: float) -> float:
+    """Percentile au rang le plus proche (valeurs déjà triées)."""
+    if not values:
+        return 0.0
+    rank = max(0, min(len(values) - 1, round(q / 100 * len(values) + 0.5) - 1))
+    return values[rank]
+
+
+def latency_stats(latencies: list[float]) -> dict:
+    values = sorted(1000 * v for v in latencies)
+    return {
+        "count": len(values),
+        "p50_ms": percentile(values, 50),
+        "p95_ms": percentile(values, 95),
+        "p99_ms": percentile(values, 99),
+        "max_ms": values[-1] if values else 0.0,
+    }
+
+
+async def run_load(url: str, sessions: int, pages: list[str], rounds: int,
+                   submit_every: int) -> tuple[list, float]:
+    samples: list = []
+    start = time.perf_counter()
+    results = await asyncio.gather(
+        *(visitor(url, i, pages, rounds, submit_every, samples) for i in range(sessions)),
+        return_exceptions=True,
+    )
+    elapsed = time.perf_counter() - start
+    for exc in results:
+        if isinstance(exc, Exception):
+            samples.append(("session", {"latency": 0.0, "bytes": 0, "alerts": [],
+                                        "errors": [repr(exc)]}))
+    return samples, elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Test de charge multi-sessions du portfolio.")
+    parser.add_argument("--sessions", type=int, default=20)
+    parser.add_argument("--rounds", type=int, default=3, help="parcours complets par session")
+    parser.add_argument("--pages", nargs="*", default=DEFAULT_PAGES)
+    parser.add_argument("--submit-every", type=int, default=5,
+                        help="une session sur N envoie le formulaire (0 : jamais)")
+    parser.add_argument("--port", type=int, default=8599)
+    parser.add_argument("--json", metavar="FICHIER", help="écrit le rapport en JSON")
+    args = parser.parse_args()
+
+    stub = start_formspree_stub()
+    server = launch_server(args.port)
+    url = f"ws://127.0.0.1:{args.port}/_stcore/stream"
+    try:
+        # Une session d'amorçage : imports et caches du processus chauds.
+        asyncio.run(run_load(url, 1, args.pages, 1, 0))
+        idle_rss = rss_bytes(server.pid)
+        sampler = RSSSampler(server.pid)
+        sampler.start()
+        samples, elapsed = asyncio.run(
+            run_load(url, args.sessions, args.pages, args.rounds, args.submit_every)
+        )
+        sampler.stop()
+        time.sleep(1.0)  # laisse l'outbox livrer les derniers messages
+    finally:
+        server.terminate()
+        server.wait(10)
+        stub.shutdown()
+
+    by_page: dict[str, list[float]] = {}
+    errors = []
+    for page, result in samples:
+        if result["errors"]:
+            errors.extend(f"{page} : {e}" for e in result["errors"])
+        elif page != "session":
+            by_page.setdefault(page, []).append(result["latency"])
+    all_latencies = [v for values in by_page.values() for v in values]
+    peak = sampler.peak or None
+    report = {
+        "sessions": args.sessions,
+        "rounds": args.rounds,
+        "renders": len(all_latencies),
+        "elapsed_s": elapsed,
+        "throughput_rps": len(all_latencies) / elapsed if elapsed else 0.0,
+        "latency": latency_stats(all_latencies),
+        "pages": {page: latency_stats(values) for page, values in by_page.items()},
+        "bytes_received": sum(r["bytes"] for _, r in samples),
+        "rss_idle_mib": idle_rss / 2**20 if idle_rss else None,
+        "rss_peak_mib": peak / 2**20 if peak else None,
+        "rss_per_session_kib": (peak - idle_rss) / 1024 / args.sessions
+        if peak and idle_rss else None,
+        "submits": sum(1 for page, r in samples if page == "contact:submit" and not r["errors"]),
+        "formspree_posts": _FormspreeStub.received,
+        "errors": errors[:50],
+        "error_count": len(errors),
+    }
+
+    lat = report["latency"]
+    print(f"{args.sessions} sessions × {args.rounds} parcours : {report['renders']} rendus "
+          f"en {elapsed:.1f} s ({report['throughput_rps']:.1f} rendus/s)")
+    print(f"Latence : p50 {lat['p50_ms']:.0f} ms  p95 {lat['p95_ms']:.0f} ms  "
+          f"p99 {lat['p99_ms']:.0f} ms  max {lat['max_ms']:.0f} ms")
+    for page, stats in report["pages"].items():
+        print(f"  {page:<16} p50 {stats['p50_ms']:6.0f}  p95 {stats['p95_ms']:6.0f}  "
+              f"p99 {stats['p99_ms']:6.0f} ms  ({stats['count']})")
+    if report["rss_peak_mib"]:
+        print(f"RSS : repos {report['rss_idle_mib']:.0f} Mio, pic {report['rss_peak_mib']:.0f} Mio, "
+              f"≈ {report['rss_per_session_kib']:.0f} Kio par session")
+    print(f"Formspree (local) : {report['formspree_posts']} message(s) reçu(s) "
+          f"pour {report['submits']} envoi(s) accepté(s)")
+    if errors:
+        print(f"Erreurs : {len(errors)} (ex. {errors[0]})")
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
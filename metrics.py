@@ -0,0 +1,246 @@
+"""Instrumentation légère : durées, tailles de payload, ratios de cache.
+
+Désactivée par défaut. Variables d'environnement :
+
+* ``PORTFOLIO_METRICS=1`` active la collecte ;
+* ``PORTFOLIO_METRICS_SAMPLE`` (0–1, défaut 1) : part des rendus mesurés ;
+* ``PORTFOLIO_METRICS_FILE`` : fichier de sortie, réécrit toutes les
+  ``PORTFOLIO_METRICS_INTERVAL`` secondes (défaut 15). Extension ``.json`` →
+  JSON, sinon format texte Prometheus (à exposer via le textfile collector
+  de node_exporter, par exemple).
+
+Désactivée, ``timed`` rend la fonction décorée telle quelle et les context
+managers ne font rien : le coût est nul en production.
+"""
+import atexit
+import functools
+import json
+import logging
+import os
+import random
+import threading
+import time
+from typing import Callable
+
+from assets import atomic_write
+
+logger = logging.getLogger(__name__)
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+ENABLED = os.environ.get("PORTFOLIO_METRICS", "0") == "1"
+SAMPLE_RATE = float(os.environ.get("PORTFOLIO_METRICS_SAMPLE", "1"))
+METRICS_FILE = os.environ.get("PORTFOLIO_METRICS_FILE", os.path.join(BASE_DIR, "metrics.prom"))
+FLUSH_INTERVAL = float(os.environ.get("PORTFOLIO_METRICS_INTERVAL", "15"))
+PREFIX = "portfolio"
+
+
+class _Series:
+    """Nombre, somme et maximum d'une série d'observations."""
+
+    __slots__ = ("count", "total", "max")
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def add(self, value: float) -> None:
+        self.count += 1
+        self.total += value
+        self.max = max(self.max, value)
+
+
+def _as_dict(series: _Series) -> dict:
+    return {"count": series.count, "sum": series.total, "max": series.max}
+
+
+class Registry:
+    """Agrégats du processus, partagés par toutes les sessions."""
+
+    def __init__(self):
+        self.timings: dict[str, _Series] = {}
+        self.sizes: dict[str, _Series] = {}
+        self.counters: dict[str, int] = {}
+        self.providers: dict[str, Callable[[], dict]] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, table: dict[str, _Series], name: str, value: float) -> None:
+        with self._lock:
+            series = table.get(name)
+            if series is None:
+                series = table[name] = _Series()
+            series.add(value)
+
+    def incr(self, name: str, value: int = 1) -> None:
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + value
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            data = {
+                "timings": {k: _as_dict(s) for k, s in self.timings.items()},
+                "sizes": {k: _as_dict(s) for k, s in self.sizes.items()},
+                "counters": dict(self.counters),
+            }
+            providers = dict(self.providers)
+        gauges = {}
+        for name, provider in providers.items():
+            try:
+                values = provider()
+            except Exception as exc:  # une source en panne ne bloque pas l'export
+                values = {"error": str(exc)}
+            gauges[name] = {
+                k: v for k, v in values.items()
+                if isinstance(v, (int, float)) and not isinstance(v, bool)
+            }
+        data["gauges"] = gauges
+        data["sample_rate"] = SAMPLE_RATE
+        data["time"] = time.time()
+        return data
+
+
+registry = Registry()
+_local = threading.local()
+
+
+# ──────────────────────────────────────────────
+# ÉCHANTILLONNAGE
+# ──────────────────────────────────────────────
+def _sampled() -> bool:
+    """Décision du rendu en cours (voir ``sample_render``), sinon tirage."""
+    decision = getattr(_local, "sampled", None)
+    if decision is None:
+        return random.random() < SAMPLE_RATE
+    return decision
+
+
+def sample_render() -> bool:
+    """Décide une fois, pour tout le rendu (thread) en cours, s'il est mesuré."""
+    _local.sampled = ENABLED and random.random() < SAMPLE_RATE
+    return _local.sampled
+
+
+# ──────────────────────────────────────────────
+# API DE MESURE
+# ──────────────────────────────────────────────
+class Timer:
+    """Chronomètre utilisable en context manager ou via start() / stop()."""
+
+    __slots__ = ("name", "_start")
+
+    def __init__(self, name: str):
+        self.name = name
+        self._start = None
+
+    def start(self) -> "Timer":
+        if ENABLED and _sampled():
+            self._start = time.perf_counter()
+        return self
+
+    def stop(self) -> None:
+        if self._start is not None:
+            registry.observe(registry.timings, self.name, time.perf_counter() - self._start)
+            self._start = None
+
+    def __enter__(self) -> "Timer":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+
+def timed(name: str):
+    """Décorateur : durée de chaque appel de la fonction sous `name`."""
+    def decorate(func):
+        if not ENABLED:
+            return func
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with Timer(name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorate
+
+
+def observe_size(name: str, nbytes: int) -> None:
+    """Taille (octets) d'un payload envoyé, p. ex. le HTML d'un ``st.html``."""
+    if ENABLED and _sampled():
+        registry.observe(registry.sizes, name, nbytes)
+
+
+def incr(name: str, value: int = 1) -> None:
+    if ENABLED:
+        registry.incr(name, value)
+
+
+def register(name: str, provider: Callable[[], dict]) -> None:
+    """Source de jauges (p. ex. ``file_cache.stats``) lue à chaque export."""
+    if ENABLED:
+        with registry._lock:
+            registry.providers[name] = provider
+
+
+# ──────────────────────────────────────────────
+# EXPORT
+# ──────────────────────────────────────────────
+def _label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"')
+
+
+def prometheus_text(snapshot: dict | None = None) -> str:
+    """Rapport au format texte Prometheus."""
+    snap = snapshot or registry.snapshot()
+    lines = []
+    for metric, table, unit in (("duration_seconds", "timings", "name"),
+                                ("payload_bytes", "sizes", "name")):
+        full = f"{PREFIX}_{metric}"
+        lines.append(f"# TYPE {full} summary")
+        for name, s in sorted(snap[table].items()):
+            label = f'{{{unit}="{_label(name)}"}}'
+            lines.append(f"{full}_count{label} {s['count']}")
+            lines.append(f"{full}_sum{label} {s['sum']:.6f}")
+        lines.append(f"# TYPE {full}_max gauge")
+        for name, s in sorted(snap[table].items()):
+            lines.append(f'{full}_max{{{unit}="{_label(name)}"}} {s["max"]:.6f}')
+    lines.append(f"# TYPE {PREFIX}_events_total counter")
+    for name, value in sorted(snap["counters"].items()):
+        lines.append(f'{PREFIX}_events_total{{name="{_label(name)}"}} {value}')
+    for source, values in sorted(snap["gauges"].items()):
+        for key, value in sorted(values.items()):
+            lines.append(f"{PREFIX}_{source}_{key} {value}")
+    return "\n".join(lines) + "\n"
+
+
+def write_report(path: str = METRICS_FILE) -> None:
+    """Écrit le rapport (JSON ou Prometheus selon l'extension), atomiquement."""
+    snap = registry.snapshot()
+    text = json.dumps(snap, indent=2) if path.endswith(".json") else prometheus_text(snap)
+    atomic_write(path, text)
+
+
+_exporter: threading.Thread | None = None
+_exporter_lock = threading.Lock()
+
+
+def start_exporter() -> None:
+    """Lance (une fois par processus) l'écriture périodique du rapport."""
+    global _exporter
+    if not ENABLED:
+        return
+    with _exporter_lock:
+        if _exporter is not None:
+            return
+
+        def loop():
+            while True:
+                time.sleep(FLUSH_INTERVAL)
+                try:
+                    write_report()
+                except OSError:
+                    logger.exception("Écriture de %s impossible", METRICS_FILE)
+
+        _exporter = threading.Thread(target=loop, name="metrics-exporter", daemon=True)
+        _exporter.start()
+        atexit.register(write_report)
@@ -0,0 +1,173 @@
+"""File d'envoi durable (SQLite) traitée par des threads en arrière-plan.
+
+Le script Streamlit ne fait qu'enregistrer le message (quelques ms) ; l'envoi
+réseau a lieu dans un pool de workers, avec nouvelles tentatives espacées
+exponentiellement en cas d'erreur temporaire (timeout, 5xx). Les messages
+survivent à un redémarrage : ceux qui étaient en cours d'envoi repassent en
+attente au démarrage suivant.
+"""
+import json
+import logging
+import random
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Iterator
+
+logger = logging.getLogger(__name__)
+
+# sender(payload) -> (succès, erreur, nouvelle tentative possible)
+Sender = Callable[[dict], tuple[bool, str, bool]]
+
+MAX_ATTEMPTS = 6
+BACKOFF_BASE = 2.0    # secondes
+BACKOFF_MAX = 300.0
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS outbox (
+    id           INTEGER PRIMARY KEY AUTOINCREMENT,
+    payload      TEXT    NOT NULL,
+    status       TEXT    NOT NULL DEFAULT 'pending',
+    attempts     INTEGER NOT NULL DEFAULT 0,
+    next_attempt REAL    NOT NULL,
+    last_error   TEXT,
+    created      REAL    NOT NULL
+);
+CREATE INDEX IF NOT EXISTS outbox_due ON outbox (status, next_attempt);
+"""
+
+
+def backoff_delay(attempts: int) -> float:
+    """Délai avant la tentative suivante (exponentiel, plafonné, avec jitter)."""
+    delay = min(BACKOFF_BASE * 2 ** (attempts - 1), BACKOFF_MAX)
+    return delay * random.uniform(0.8, 1.2)
+
+
+class Outbox:
+    def __init__(self, path: str, sender: Sender, workers: int = 2,
+                 max_attempts: int = MAX_ATTEMPTS):
+        self.path = path
+        self.sender = sender
+        self.workers = workers
+        self.max_attempts = max_attempts
+        self._wakeup = threading.Event()
+        self._stop = threading.Event()
+        self._threads: list[threading.Thread] = []
+        with self._connect() as db:
+            db.execute("PRAGMA journal_mode=WAL")
+            db.executescript(_SCHEMA)
+            # Reprise après arrêt brutal : rien ne peut être « en cours ».
+            db.execute("UPDATE outbox SET status = 'pending' WHERE status = 'sending'")
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        # Mode autocommit : chaque écriture est durable dès son retour ;
+        # fermer la connexion annule une transaction laissée ouverte.
+        db = sqlite3.connect(self.path, timeout=10, isolation_level=None)
+        try:
+            yield db
+        finally:
+            db.close()
+
+    # ── API ──────────────────────────────────────────────────────────────────
+    def enqueue(self, payload: dict) -> int:
+        """Enregistre le message sur disque et réveille un worker."""
+        now = time.time()
+        with self._connect() as db:
+            cur = db.execute(
+                "INSERT INTO outbox (payload, next_attempt, created) VALUES (?, ?, ?)",
+                (json.dumps(payload, ensure_ascii=False), now, now),
+            )
+        self._wakeup.set()
+        return cur.lastrowid
+
+    def counts(self) -> dict[str, int]:
+        with self._connect() as db:
+            return dict(db.execute("SELECT status, COUNT(*) FROM outbox GROUP BY status"))
+
+    def start(self) -> None:
+        if self._threads:
+            return
+        for i in range(self.workers):
+            t = threading.Thread(target=self._run, name=f"outbox-{i}", daemon=True)
+            t.start()
+            self._threads.append(t)
+
+    def stop(self, timeout: float | None = None) -> None:
+        self._stop.set()
+        self._wakeup.set()
+        for t in self._threads:
+            t.join(timeout)
+        self._threads.clear()
+
+    # ── Workers ──────────────────────────────────────────────────────────────
+    def _claim(self) -> tuple[int, dict, int] | float | None:
+        """Réserve le prochain message dû ; sinon retourne l'échéance suivante."""
+        now = time.time()
+        with self._connect() as db:
+            db.execute("BEGIN IMMEDIATE")
+            row = db.execute(
+                "SELECT id, payload, attempts FROM outbox "
+                "WHERE status = 'pending' AND next_attempt <= ? "
+                "ORDER BY next_attempt LIMIT 1",
+                (now,),
+            ).fetchone()
+            if row is None:
+                nxt = db.execute(
+                    "SELECT MIN(next_attempt) FROM outbox WHERE status = 'pending'"
+                ).fetchone()[0]
+                db.execute("COMMIT")
+                return nxt
+            db.execute("UPDATE outbox SET status = 'sending' WHERE id = ?", (row[0],))
+            db.execute("COMMIT")
+        return row[0], json.loads(row[1]), row[2]
+
+    def _finish(self, msg_id: int, attempts: int, ok: bool, error: str, retry: bool) -> None:
+        if ok:
+            status, next_attempt = "sent", 0.0
+        elif retry and attempts < self.max_attempts:
+            status, next_attempt = "pending", time.time() + backoff_delay(attempts)
+        else:
+            status, next_attempt = "failed", 0.0
+            logger.error("Message %s abandonné après %s tentative(s) : %s", msg_id, attempts, error)
+        with self._connect() as db:
+            db.execute(
+                "UPDATE outbox SET status = ?, attempts = ?, next_attempt = ?, last_error = ? "
+                "WHERE id = ?",
+                (status, attempts, next_attempt, error or None, msg_id),
+            )
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            self._wakeup.clear()
+            try:
+                claimed = self._claim()
+            except sqlite3.Error:
+                logger.exception("Lecture de l'outbox impossible")
+                self._stop.wait(BACKOFF_BASE)
+                continue
+
+            if not isinstance(claimed, tuple):
+                timeout = None if claimed is None else max(claimed - time.time(), 0.05)
+                self._wakeup.wait(timeout)
+                continue
+
+            msg_id, payload, attempts = claimed
+            try:
+                ok, error, retry = self.sender(payload)
+            except Exception as exc:  # un worker ne doit jamais mourir
+                ok, error, retry = False, str(exc), True
+            self._record(msg_id, attempts + 1, ok, error, retry)
+
+    def _record(self, msg_id: int, attempts: int, ok: bool, error: str, retry: bool) -> None:
+        """``_finish`` répété tant que la base refuse l'écriture (verrou…) :
+        le message ne doit pas rester « en cours » jusqu'au redémarrage."""
+        while True:
+            try:
+                self._finish(msg_id, attempts, ok, error, retry)
+                return
+            except sqlite3.Error:
+                logger.exception("Mise à jour du message %s impossible", msg_id)
+                if self._stop.wait(BACKOFF_BASE):
+                    return  # arrêt : repassera en attente au démarrage suivant
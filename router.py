@@ -0,0 +1,63 @@
+"""Routage : une page (clé de ``PAGES``) → un module de ``views/``.
+
+Le module d'une page n'est importé qu'à sa première visite dans le
+processus, puis gardé : un rendu n'exécute que le code de la page demandée.
+Chaque page peut aussi être rendue seule (tests, benchmarks) via
+``router.render(page)``.
+"""
+import importlib
+import threading
+from types import ModuleType
+
+import streamlit as st
+
+import metrics
+from fragments import STATIC_PAGES
+from static_pages import PAGES
+
+DEFAULT_PAGE = "home"
+ROUTES: dict[str, str] = {
+    "home": "views.home",
+    "contact": "views.contact",
+    **{page: "views.static_page" for page in STATIC_PAGES},
+}
+
+
+class Router:
+    """Modules de pages importés à la demande."""
+
+    def __init__(self, routes: dict[str, str]):
+        self.routes = routes
+        self._views: dict[str, ModuleType] = {}
+        self._lock = threading.Lock()
+
+    def view(self, page: str) -> ModuleType:
+        module = self._views.get(page)
+        if module is None:
+            with self._lock:
+                module = self._views.get(page)
+                if module is None:
+                    with metrics.Timer(f"import.{page}"):
+                        module = importlib.import_module(self.routes[page])
+                    self._views[page] = module
+        return module
+
+    def render(self, page: str) -> None:
+        with metrics.Timer(f"page.{page}"):
+            self.view(page).render(page)
+
+    def loaded(self) -> list[str]:
+        return sorted(self._views)
+
+
+router = Router(ROUTES)
+
+
+def current_page() -> str:
+    """Page demandée : ``?page=`` si valide, sinon celle de la session."""
+    page = st.query_params.get("page")
+    if page in PAGES.values() and page in ROUTES:
+        st.session_state.page = page
+    elif st.session_state.get("page") not in ROUTES:
+        st.session_state.page = DEFAULT_PAGE
+    return st.session_state.page
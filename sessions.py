@@ -0,0 +1,272 @@
+"""Suivi mémoire par session et libération de l'état des sessions inactives.
+
+Chaque rendu appelle ``track(page)`` : le registre du processus note, par
+session Streamlit, la page, l'heure du dernier rendu et une estimation des
+octets retenus (valeurs de ``st.session_state`` et fichiers déposés).
+
+Un thread « reaper » parcourt le registre toutes les ``REAP_INTERVAL``
+secondes :
+
+* les sessions fermées sont oubliées ;
+* une session inactive depuis ``PORTFOLIO_SESSION_TTL`` secondes perd son
+  état lourd (fichiers déposés, valeurs de plus de ``HEAVY_BYTES``) ; la
+  navigation et l'état léger restent intacts.
+
+L'estimation des fichiers déposés et la purge de l'état d'une autre session
+passent par des internes de Streamlit (non épinglé) : s'ils changent, ces
+deux mesures sont désactivées (0 octet compté, seuls les fichiers déposés
+sont libérés, par l'API publique) au lieu de faire échouer l'app.
+
+Avec ``PORTFOLIO_SESSION_REPORT=chemin.json``, le rapport par session est
+réécrit à chaque passage (dimensionnement des conteneurs).
+"""
+import io
+import json
+import logging
+import os
+import sys
+import threading
+import time
+
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+from assets import atomic_write
+
+logger = logging.getLogger(__name__)
+
+SESSION_TTL = float(os.environ.get("PORTFOLIO_SESSION_TTL", "900"))
+REAP_INTERVAL = float(os.environ.get("PORTFOLIO_REAP_INTERVAL", str(min(60.0, SESSION_TTL / 4))))
+HEAVY_BYTES = int(os.environ.get("PORTFOLIO_SESSION_HEAVY_BYTES", str(16 * 1024)))
+REPORT_PATH = os.environ.get("PORTFOLIO_SESSION_REPORT", "")
+# Clés toujours considérées comme lourdes (widget de dépôt du CV).
+HEAVY_PREFIXES = ("cv_upload",)
+
+
+def value_size(value) -> int:
+    """Estimation (octets) de la mémoire retenue par une valeur d'état."""
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return len(value)
+    if isinstance(value, str):
+        return len(value.encode())
+    if isinstance(value, io.BytesIO):       # UploadedFile compris
+        return value.getbuffer().nbytes
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return sys.getsizeof(value) + sum(value_size(v) for v in value)
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(value_size(v) for v in value.values())
+    return sys.getsizeof(value)
+
+
+def _is_heavy(key: str, size: int) -> bool:
+    return key.startswith(HEAVY_PREFIXES) or size >= HEAVY_BYTES
+
+
+def _upload_bytes(ctx) -> int:
+    # MemoryUploadedFileManager (gestionnaire par défaut) : {session: {id: fichier}},
+    # modifié par les threads du serveur sous son verrou.
+    mgr = ctx.uploaded_file_mgr
+    storage, lock = getattr(mgr, "file_storage", None), getattr(mgr, "_lock", None)
+    if storage is None or lock is None:
+        return 0
+    with lock:
+        files = list(storage.get(ctx.session_id, {}).values())
+    return sum(len(f.data) for f in files)
+
+
+def _app_session(runtime, session_id: str):
+    """AppSession d'une autre session, ou None si les internes du runtime
+    utilisés ici n'existent pas (ou plus) dans cette version de Streamlit."""
+    get_info = getattr(getattr(runtime, "_session_mgr", None), "get_session_info", None)
+    info = get_info(session_id) if get_info is not None else None
+    session = getattr(info, "session", None)
+    needed = ("session_state", "_scriptrunner", "_call_soon_on_event_loop")
+    if session is None or not all(hasattr(session, name) for name in needed):
+        return None
+    return session
+
+
+class SessionRecord:
+    __slots__ = ("session_id", "page", "last_seen", "runs", "state_bytes",
+                 "heavy_bytes", "upload_bytes", "keys", "evictions")
+
+    def __init__(self, session_id: str):
+        self.session_id = session_id
+        self.page = ""
+        self.last_seen = 0.0
+        self.runs = 0
+        self.state_bytes = 0
+        self.heavy_bytes = 0     # part de state_bytes libérable par le reaper
+        self.upload_bytes = 0
+        self.keys = 0
+        self.evictions = 0
+
+    def as_dict(self, now: float) -> dict:
+        return {
+            "session": self.session_id,
+            "page": self.page,
+            "idle_s": round(now - self.last_seen, 1),
+            "runs": self.runs,
+            "keys": self.keys,
+            "state_bytes": self.state_bytes,
+            "heavy_bytes": self.heavy_bytes,
+            "upload_bytes": self.upload_bytes,
+            "total_bytes": self.state_bytes + self.upload_bytes,
+            "evictions": self.evictions,
+        }
+
+
+class SessionRegistry:
+    """Empreinte mémoire des sessions du processus."""
+
+    def __init__(self, ttl: float = SESSION_TTL):
+        self.ttl = ttl
+        self.evicted = 0
+        self._internals_missing = False
+        self._records: dict[str, SessionRecord] = {}
+        self._lock = threading.Lock()
+
+    def track(self, page: str) -> SessionRecord | None:
+        """Met à jour la session courante (appelé en fin de rendu)."""
+        ctx = get_script_run_ctx(suppress_warning=True)
+        if ctx is None:
+            return None
+        state = ctx.session_state.filtered_state
+        sizes = {key: value_size(value) for key, value in state.items()}
+        heavy_bytes = sum(size for key, size in sizes.items() if _is_heavy(key, size))
+        upload_bytes = _upload_bytes(ctx)
+        with self._lock:
+            record = self._records.get(ctx.session_id)
+            if record is None:
+                record = self._records[ctx.session_id] = SessionRecord(ctx.session_id)
+            record.page = page
+            record.last_seen = time.time()
+            record.runs += 1
+            record.keys = len(state)
+            record.state_bytes = sum(sizes.values())
+            record.heavy_bytes = heavy_bytes
+            record.upload_bytes = upload_bytes
+        return record
+
+    def report(self) -> list[dict]:
+        now = time.time()
+        with self._lock:
+            rows = [r.as_dict(now) for r in self._records.values()]
+        return sorted(rows, key=lambda r: -r["total_bytes"])
+
+    def stats(self) -> dict:
+        rows = self.report()
+        totals = [r["total_bytes"] for r in rows]
+        return {
+            "sessions": len(rows),
+            "total_bytes": sum(totals),
+            "max_bytes": max(totals, default=0),
+            "avg_bytes": sum(totals) / len(totals) if totals else 0.0,
+            "evicted": self.evicted,
+        }
+
+    # ── Reaper ───────────────────────────────────────────────────────────────
+    def reap(self) -> int:
+        """Oublie les sessions fermées, allège les inactives ; retourne le
+        nombre de sessions allégées."""
+        from streamlit.runtime import Runtime
+
+        if not Runtime.exists():
+            return 0
+        runtime = Runtime.instance()
+        limit = time.time() - self.ttl
+        with self._lock:
+            records = list(self._records.values())
+        evicted = 0
+        for record in records:
+            if not runtime.is_active_session(record.session_id):
+                with self._lock:
+                    self._records.pop(record.session_id, None)
+                continue
+            if record.last_seen > limit or not (record.heavy_bytes or record.upload_bytes):
+                continue
+            if self._evict(runtime, record):
+                evicted += 1
+        return evicted
+
+    def _evict(self, runtime, record: SessionRecord) -> bool:
+        runtime.uploaded_file_mgr.remove_session_files(record.session_id)
+        with self._lock:
+            record.upload_bytes = 0
+            record.evictions += 1
+            self.evicted += 1
+        # Pas d'API publique pour l'état d'une autre session : on passe par
+        # l'AppSession. La purge est confiée à sa boucle d'événements, où
+        # seuls les rendus démarrent : si aucun ne tourne, aucun ne peut
+        # commencer pendant la purge.
+        session = _app_session(runtime, record.session_id)
+        if session is None:
+            if not self._internals_missing:
+                self._internals_missing = True
+                logger.warning("Internes de Streamlit introuvables : état des sessions "
+                               "inactives conservé (seuls les fichiers déposés sont libérés)")
+            with self._lock:
+                record.heavy_bytes = 0   # rien de plus à libérer : pas de nouvel essai
+            return True
+        session._call_soon_on_event_loop(lambda: self._purge_state(session, record))
+        return True
+
+    def _purge_state(self, session, record: SessionRecord) -> None:
+        """Retire l'état lourd de `session` ; exécuté sur sa boucle d'événements."""
+        if session._scriptrunner is not None:   # rendu en cours : session active
+            return
+        state = session.session_state
+        freed = 0
+        for key, value in list(state.filtered_state.items()):
+            size = value_size(value)
+            if _is_heavy(key, size):
+                try:
+                    del state[key]
+                except KeyError:
+                    continue
+                freed += size
+        with self._lock:
+            record.state_bytes = max(0, record.state_bytes - freed)
+            record.heavy_bytes = 0
+        logger.info("Session %s inactive : %s octets libérés", record.session_id, freed)
+
+    def write_report(self, path: str = REPORT_PATH) -> None:
+        data = {"time": time.time(), "ttl": self.ttl, **self.stats(), "per_session": self.report()}
+        atomic_write(path, json.dumps(data, indent=2))
+
+
+registry = SessionRegistry()
+_reaper: threading.Thread | None = None
+_reaper_lock = threading.Lock()
+
+
+def start_reaper() -> None:
+    """Lance (une fois par processus) le thread de ménage des sessions."""
+    global _reaper
+    with _reaper_lock:
+        if _reaper is not None:
+            return
+
+        def loop():
+            while True:
+                time.sleep(REAP_INTERVAL)
+                try:
+                    registry.reap()
+                    if REPORT_PATH:
+                        registry.write_report()
+                except Exception:  # le reaper ne doit jamais mourir
+                    logger.exception("Ménage des sessions impossible")
+
+        _reaper = threading.Thread(target=loop, name="session-reaper", daemon=True)
+        _reaper.start()
+
+
+def release_uploads() -> None:
+    """Libère tout de suite les fichiers déposés par la session courante."""
+    ctx = get_script_run_ctx(suppress_warning=True)
+    if ctx is not None:
+        ctx.uploaded_file_mgr.remove_session_files(ctx.session_id)
+
+
+def track(page: str) -> None:
+    registry.track(page)
+
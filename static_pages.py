@@ -0,0 +1,333 @@
+"""HTML des pages du portfolio (navigation, pages, pied de page).
+
+Ces fonctions ne dépendent pas de Streamlit : elles retournent des chaînes,
+construites à partir du modèle de ``content.py``. Elles servent à la fois à
+l'app (via le cache de ``fragments.py``) et à l'export statique (``export.py``).
+"""
+from typing import Callable
+
+from content import Content, HeroStat, Project, Skill
+
+# À incrémenter à chaque modification des gabarits ci-dessous : invalide les
+# fragments déjà rendus (le contenu, lui, est versionné par son empreinte).
+TEMPLATE_VERSION = "3"
+
+
+# ──────────────────────────────────────────────
+# NAVIGATION
+# ──────────────────────────────────────────────
+PAGES = {
+    "🏠 Accueil":      "home",
+    "👤 À propos":     "about",
+    "⚡ Compétences":  "skills",
+    "🚀 Projets":      "projects",
+    "📚 Parcours":     "experience",
+    "📬 Contact":      "contact",
+}
+
+
+def nav_html(page: str) -> str:
+    links_html = ""
+    for label, key in PAGES.items():
+        active = "active" if key == page else ""
+        short = label.split(" ", 1)[1]
+        links_html += f'<a class="{active}" href="?page={key}" target="_self">{short}</a>'
+
+    return f"""<nav class="pf-nav">
+<div class="pf-logo">NJIPANG <em>ERASTE</em></div>
+<div class="pf-nav-links">{links_html}</div>
+<div class="pf-avail"><div class="pf-dot"></div>Disponible pour projets</div>
+</nav>"""
+
+
+FOOTER_HTML = """<footer class="pf-footer">
+<div class="pf-footer-logo">NJIPANG <em>ERASTE</em></div>
+<p style="margin-bottom: 2rem; opacity: 0.7;">Développeur IA & Python passionné par l'innovation.</p>
+<div class="pf-footer-copy">© 2026 NJIPANG DONGMO Eraste — Tous droits réservés</div>
+</footer>"""
+
+
+# ══════════════════════════════════════════════
+# PAGE : HOME
+# ══════════════════════════════════════════════
+def photo_block_html(photo: tuple[str, str] | None) -> str:
+    """Vignette cliquable + lightbox (sans JS) à partir de (vignette, grande image)."""
+    if not photo:
+        return '<div class="profile-placeholder">NE</div>'
+    return f"""<input type="checkbox" id="lightbox-toggle">
+<label for="lightbox-toggle" class="photo-trigger">
+<div class="profile-circle">{photo[0]}</div>
+</label>
+<label for="lightbox-toggle" class="photo-lightbox">
+{photo[1]}
+</label>"""
+
+
+def hero_stats_html(stats: tuple[HeroStat, ...]) -> str:
+    return "\n".join(
+        f"""<div class="hero-stat">
+<div class="hero-stat-num">{s.value}</div>
+<div class="hero-stat-lbl">{s.label}</div>
+</div>"""
+        for s in stats
+    )
+
+
+def home_html(content: Content, photo_html: str) -> str:
+    return f"""<div class="pf-section active">
+<div class="hero">
+<div class="hero-left">
+<div class="hero-tag">Basé à Douala, Cameroun</div>
+<h1 class="hero-name">NJIPANG<br>DONGMO<br><em>Eraste</em></h1>
+<p class="hero-desc">
+Développeur spécialisé en <strong>Intelligence Artificielle</strong> & <strong>Python</strong>. 
+Je conçois des solutions innovantes en transformant les données en outils décisionnels performants.
+</p>
+<div class="hero-ctas">
+<a class="btn-primary" href="?page=projects" target="_self">Découvrir mes projets</a>
+<a class="btn-outline" href="?page=contact" target="_self">Me contacter</a>
+</div>
+</div>
+<div class="hero-right">
+<div class="hero-card">
+{photo_html}
+<div class="hero-stats">
+{hero_stats_html(content.hero_stats)}
+</div>
+<div class="hero-links">
+<a href="https://github.com/njipangeraste" target="_blank" class="hero-link-btn">GitHub</a>
+<a href="https://www.linkedin.com/in/eraste-njipang-162162266/" target="_blank" class="hero-link-btn">LinkedIn</a>
+</div>
+</div>
+</div>
+</div>
+</div>"""
+
+
+# ══════════════════════════════════════════════
+# PAGE : ABOUT
+# ══════════════════════════════════════════════
+def about_html(content: Content) -> str:
+    return """<div class="pf-section active">
+<div class="section-inner">
+<span class="eyebrow">Mon Profil</span>
+<h2 class="section-title">Passionné par l'innovation technologique</h2>
+<div class="about-grid">
+<div class="about-block about-full">
+<div class="about-block-label">Mon Parcours</div>
+<p>
+Je suis un développeur passionné par l'<strong>Intelligence Artificielle</strong> et les systèmes complexes. 
+Ma formation en <strong>Génie Logiciel</strong> m'a permis d'acquérir une base solide en conception d'architectures robustes, 
+que j'applique aujourd'hui au domaine du <strong>Machine Learning</strong>.
+</p>
+<br>
+<p>
+Mon expertise pratique se concentre sur l'intégration de modèles de Deep Learning (TensorFlow/Keras) au sein d'applications hybrides 
+concrètes, alliant performance backend et expérience utilisateur fluide.
+</p>
+</div>
+<div class="about-block">
+<div class="about-block-label">Mes Objectifs</div>
+<ul>
+<li>Conception de systèmes IA scalables</li>
+<li>Optimisation de processus via l'analyse de données</li>
+<li>Veille constante sur les modèles LLM et Computer Vision</li>
+<li>Développement de code propre (Clean Code) et maintenable</li>
+</ul>
+</div>
+<div class="about-block">
+<div class="about-block-label">Compétences Linguistiques</div>
+<div class="lang-row">
+<span class="lang-name">Français</span>
+<span class="lang-level">Natif / Bilingue</span>
+</div>
+<div class="lang-row">
+<span class="lang-name">Anglais</span>
+<span class="lang-level">Débutant (A1/A2)</span>
+</div>
+</div>
+</div>
+</div>
+</div>"""
+
+
+# ══════════════════════════════════════════════
+# PAGE : SKILLS
+# ══════════════════════════════════════════════
+def skill_card(logo_url, name, progress):
+    return f"""<div class="skill-row">
+<div class="skill-header">
+<div class="skill-icon"><img src="{logo_url}" alt="{name}"></div>
+<div class="skill-name">{name}</div>
+</div>
+<div class="skill-progress-bg">
+<div class="skill-progress-bar" style="width: {progress}%"></div>
+</div>
+</div>"""
+
+
+def cdn_icon(skill: Skill) -> str:
+    return skill.logo_url
+
+
+def skills_html(content: Content, icon_url: Callable[[Skill], str] = cdn_icon) -> str:
+    categories = "".join(
+        f'<div class="skills-cat-title">{cat.title}</div>\n'
+        f'<div class="skills-grid">{"".join(skill_card(icon_url(s), s.name, s.level) for s in cat.items)}</div>\n'
+        for cat in content.skills
+    )
+
+    return f"""<div class="pf-section active">
+<div class="section-inner">
+<span class="eyebrow">Expertise</span>
+<h2 class="section-title">Compétences Techniques</h2>
+{categories}</div>
+</div>"""
+
+
+# ══════════════════════════════════════════════
+# PAGE : PROJECTS
+# ══════════════════════════════════════════════
+def project_card(num, category, title, goal, desc, tags, github_url, image_html, demo_url=None):
+    tags_html = "".join(f'<span class="tag">{t}</span>' for t in tags)
+    demo_btn  = f'<a class="btn-outline" href="{demo_url}" target="_blank">Démo Live</a>' if demo_url else ""
+    return f"""<div class="project-item">
+<div class="project-content">
+<div class="project-num">{num} — {category}</div>
+<h3 class="project-title">{title}</h3>
+<div class="project-goal"><em>But du projet</em>{goal}</div>
+<p class="project-desc">{desc}</p>
+<div class="project-tags">{tags_html}</div>
+<div style="display: flex; gap: 10px;">
+<a class="btn-primary" href="{github_url}" target="_blank">Voir Code</a>
+{demo_btn}
+</div>
+</div>
+<div class="project-image-container">
+{image_html}
+</div>
+</div>"""
+
+
+PROJECT_IMAGE_SIZE = (480, 280)  # .project-image-container, affichage 1x
+
+
+def remote_image(project: Project) -> str:
+    """Image du projet chargée directement depuis son URL d'origine."""
+    w, h = PROJECT_IMAGE_SIZE
+    return (
+        f'<img src="{project.image_url}" class="project-image" alt="{project.title}" '
+        f'width="{w}" height="{h}" loading="lazy" decoding="async">'
+    )
+
+
+def projects_html(content: Content,
+                  image_html: Callable[[Project], str] = remote_image) -> str:
+    cards = "".join(
+        project_card(p.num, p.category, p.title, p.goal, p.description, p.tags,
+                     p.github_url, image_html(p), p.demo_url)
+        for p in content.projects
+    )
+
+    return f"""<div class="pf-section active">
+<div class="section-inner">
+<span class="eyebrow">Portfolio</span>
+<h2 class="section-title">Projets Sélectionnés</h2>
+{cards}
+</div>
+</div>"""
+
+
+# ══════════════════════════════════════════════
+# PAGE : EXPERIENCE
+# ══════════════════════════════════════════════
+def exp_item(period, title, company, desc):
+    return f"""<div class="exp-item">
+<div class="exp-period">{period}</div>
+<div class="exp-title">{title}</div>
+<div class="exp-company">{company}</div>
+<p class="exp-desc">{desc}</p>
+</div>"""
+
+
+def edu_item(period, title, school):
+    return f"""<div class="exp-item">
+<div class="exp-period">{period}</div>
+<div class="exp-title">{title}</div>
+<div class="exp-company">{school}</div>
+</div>"""
+
+
+def experience_html(content: Content) -> str:
+    jobs = "".join(exp_item(e.period, e.title, e.company, e.description) for e in content.experience)
+    schools = "".join(edu_item(e.period, e.title, e.school) for e in content.education)
+
+    return f"""<div class="pf-section active">
+<div class="section-inner">
+<span class="eyebrow">Parcours</span>
+<h2 class="section-title">Expériences & Éducation</h2>
+<div class="skills-cat-title">Expériences Professionnelles</div>
+<div class="exp-timeline">
+{jobs}
+</div>
+<div class="skills-cat-title" style="margin-top:4rem">Formation Académique</div>
+<div class="exp-timeline">
+{schools}
+</div>
+</div>
+</div>"""
+
+
+# ══════════════════════════════════════════════
+# PAGE : CONTACT
+# ══════════════════════════════════════════════
+def contact_html() -> str:
+    return """<div class="pf-section active">
+<div class="section-inner">
+<span class="eyebrow">Contact</span>
+<h2 class="section-title">Discutons de votre projet</h2>
+<p class="contact-note">
+Que vous ayez un projet en tête, une opportunité professionnelle ou simplement
+envie d'échanger sur l'IA et la tech — je réponds généralement sous 24h.
+</p>
+<div class="contact-grid">
+<div class="contact-card">
+<div class="contact-icon">📧</div>
+<div class="contact-label">Email</div>
+<div class="contact-value"><a href="mailto:enjipang@gmail.com">enjipang@gmail.com</a></div>
+</div>
+<div class="contact-card">
+<div class="contact-icon">📞</div>
+<div class="contact-label">Téléphone</div>
+<div class="contact-value">+237 673 13 30 12</div>
+</div>
+<div class="contact-card">
+<div class="contact-icon">💼</div>
+<div class="contact-label">LinkedIn</div>
+<div class="contact-value">
+<a href="https://www.linkedin.com/in/eraste-njipang-162162266/" target="_blank">
+eraste-njipang ↗
+</a>
+</div>
+</div>
+<div class="contact-card">
+<div class="contact-icon">🐙</div>
+<div class="contact-label">GitHub</div>
+<div class="contact-value">
+<a href="https://github.com/njipangeraste" target="_blank">njipangeraste ↗</a>
+</div>
+</div>
+</div>
+</div>
+</div>
+<div style="max-width:1080px; margin: 0 auto; padding: 0 3rem 2rem;">
+<div class="skills-cat-title">Envoyer un message</div>
+</div>"""
+
+
+BUILDERS = {
+    "about":      about_html,
+    "skills":     skills_html,
+    "projects":   projects_html,
+    "experience": experience_html,
+}
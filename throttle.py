@@ -0,0 +1,126 @@
+"""Limitation de débit et déduplication des envois du formulaire de contact.
+
+Deux structures en mémoire, partagées par toutes les sessions du processus,
+dont les entrées expirent d'elles-mêmes (TTL) :
+
+* ``RateLimiter`` : un seau à jetons par clé (session, email) ;
+* ``Deduplicator`` : empreinte du contenu des messages déjà acceptés, pour
+  ignorer un double clic ou un renvoi à l'identique dans la fenêtre.
+"""
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Hashable
+
+MAX_KEYS = 10_000   # borne mémoire, quelle que soit la charge
+
+
+class RateLimited(Exception):
+    """Trop d'envois pour cette clé ; ``retry_after`` en secondes."""
+
+    def __init__(self, key: str, retry_after: float):
+        super().__init__(f"Trop d'envois ({key}) : réessayez dans {retry_after:.0f} s.")
+        self.key = key
+        self.retry_after = retry_after
+
+
+class _TTLMap:
+    """Dictionnaire LRU dont les entrées expirent `ttl` secondes après leur
+    dernière écriture ; l'éviction se fait au fil des accès, sans thread."""
+
+    def __init__(self, ttl: float, max_keys: int = MAX_KEYS,
+                 clock: Callable[[], float] = time.monotonic):
+        self.ttl = ttl
+        self.max_keys = max_keys
+        self.clock = clock
+        self._entries: OrderedDict[Hashable, tuple[float, object]] = OrderedDict()
+
+    def get(self, key: Hashable):
+        self._evict()
+        entry = self._entries.get(key)
+        return entry[1] if entry else None
+
+    def set(self, key: Hashable, value) -> None:
+        self._entries[key] = (self.clock(), value)
+        self._entries.move_to_end(key)
+        self._evict()
+
+    def _evict(self) -> None:
+        limit = self.clock() - self.ttl
+        while self._entries:
+            key, (stamp, _) = next(iter(self._entries.items()))
+            if stamp > limit and len(self._entries) <= self.max_keys:
+                break
+            del self._entries[key]
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class RateLimiter:
+    """Seaux à jetons : `capacity` envois d'affilée, puis un toutes les
+    `refill_seconds`. Un seau inutilisé assez longtemps pour être plein est
+    simplement oublié."""
+
+    def __init__(self, capacity: int, refill_seconds: float,
+                 clock: Callable[[], float] = time.monotonic):
+        self.capacity = capacity
+        self.refill_seconds = refill_seconds
+        self.clock = clock
+        self.rejected = 0
+        self._buckets = _TTLMap(capacity * refill_seconds, clock=clock)
+        self._lock = threading.Lock()
+
+    def _level(self, key: str, now: float) -> float:
+        state = self._buckets.get(key)
+        if state is None:
+            return float(self.capacity)
+        tokens, stamp = state
+        return min(self.capacity, tokens + (now - stamp) / self.refill_seconds)
+
+    def acquire(self, *keys: str) -> None:
+        """Consomme un jeton de chaque clé, ou aucun : lève ``RateLimited``."""
+        with self._lock:
+            now = self.clock()
+            levels = {key: self._level(key, now) for key in keys}
+            for key, tokens in levels.items():
+                if tokens < 1:
+                    self.rejected += 1
+                    raise RateLimited(key.split(":", 1)[0], (1 - tokens) * self.refill_seconds)
+            for key, tokens in levels.items():
+                self._buckets.set(key, (tokens - 1, now))
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"keys": len(self._buckets), "rejected": self.rejected}
+
+
+class Deduplicator:
+    """Mémorise l'empreinte des messages acceptés pendant `window` secondes."""
+
+    def __init__(self, window: float, clock: Callable[[], float] = time.monotonic):
+        self.duplicates = 0
+        self._seen = _TTLMap(window, clock=clock)
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def fingerprint(*fields: str) -> str:
+        normalized = "\x1f".join(" ".join(f.split()).casefold() for f in fields)
+        return hashlib.sha256(normalized.encode()).hexdigest()
+
+    def seen(self, fingerprint: str):
+        """Valeur associée à un message identique récent, sinon None."""
+        with self._lock:
+            value = self._seen.get(fingerprint)
+            if value is not None:
+                self.duplicates += 1
+            return value
+
+    def remember(self, fingerprint: str, value) -> None:
+        with self._lock:
+            self._seen.set(fingerprint, value)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"entries": len(self._seen), "duplicates": self.duplicates}
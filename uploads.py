@@ -0,0 +1,97 @@
+"""Dépôt du CV depuis l'app : flux → fichier temporaire vérifié → CV partagé.
+
+Le fichier déposé est recopié par blocs dans un fichier temporaire du
+dossier du CV, sans ``getvalue()`` : signature PDF vérifiée sur le premier
+bloc, taille plafonnée au fil de l'écriture. Le fichier validé est ensuite
+renommé (atomiquement) là où ``cv_locator`` le trouvera : toutes les
+sessions servent alors la même copie sur disque au lieu de garder chacune
+la sienne en mémoire.
+
+Seul le propriétaire publie : il faut fournir ``PORTFOLIO_UPLOAD_TOKEN`` (ou
+``upload_token`` des secrets Streamlit, voir ``views/home.py``). Sans jeton
+configuré, aucun dépôt n'est publié.
+"""
+import hmac
+import os
+import threading
+from typing import BinaryIO
+
+from assets import atomic_path
+from loaders import CV_CANDIDATES, CVLocator, cv_locator
+
+MAX_CV_BYTES = int(os.environ.get("PORTFOLIO_CV_MAX_BYTES", str(10 * 1024 * 1024)))
+UPLOAD_TOKEN = os.environ.get("PORTFOLIO_UPLOAD_TOKEN", "")
+PDF_MAGIC = b"%PDF-"
+CHUNK = 64 * 1024
+
+_lock = threading.Lock()
+
+
+class UploadRejected(ValueError):
+    """Fichier déposé refusé (type, taille, CV déjà en place)."""
+
+
+def is_owner(candidate: str, token: str = UPLOAD_TOKEN) -> bool:
+    """Vrai si `candidate` est le jeton de publication (comparaison à temps
+    constant) ; toujours faux sans jeton configuré."""
+    return bool(token) and hmac.compare_digest(candidate.encode(), token.encode())
+
+
+def _too_large(max_bytes: int) -> UploadRejected:
+    return UploadRejected(f"Fichier trop volumineux (max {max_bytes / 2**20:.1f} Mo).")
+
+
+def cv_target(locator: CVLocator = cv_locator) -> str:
+    """Emplacement où promouvoir le CV déposé."""
+    return locator.configured_path or os.path.join(locator.base_dir, CV_CANDIDATES[0])
+
+
+def _copy_checked(src: BinaryIO, dst: BinaryIO, max_bytes: int) -> int:
+    head = src.read(len(PDF_MAGIC))
+    if head != PDF_MAGIC:
+        raise UploadRejected("Le fichier n'est pas un PDF.")
+    dst.write(head)
+    size = len(head)
+    while chunk := src.read(CHUNK):
+        size += len(chunk)
+        if size > max_bytes:
+            raise _too_large(max_bytes)
+        dst.write(chunk)
+    return size
+
+
+def check_pdf(upload: BinaryIO, max_bytes: int = MAX_CV_BYTES) -> BinaryIO:
+    """Vérifie `upload` (signature PDF, taille) sans le copier ; le retourne
+    rembobiné. Lève ``UploadRejected``."""
+    size = getattr(upload, "size", None)
+    if size is not None and size > max_bytes:
+        raise _too_large(max_bytes)
+    upload.seek(0)
+    with open(os.devnull, "wb") as sink:
+        _copy_checked(upload, sink, max_bytes)
+    upload.seek(0)
+    return upload
+
+
+def promote_cv(upload: BinaryIO, locator: CVLocator = cv_locator,
+               max_bytes: int = MAX_CV_BYTES) -> str:
+    """Vérifie `upload` et l'installe comme CV ; retourne son chemin.
+
+    Lève ``UploadRejected`` si le fichier n'est pas un PDF, dépasse
+    `max_bytes`, ou si un CV est déjà en place (le premier dépôt gagne).
+    """
+    size = getattr(upload, "size", None)
+    if size is not None and size > max_bytes:
+        raise _too_large(max_bytes)
+    target = cv_target(locator)
+    upload.seek(0)
+    with _lock:
+        if locator.find():
+            raise UploadRejected("Un CV est déjà en ligne.")
+        with atomic_path(target) as tmp, open(tmp, "wb") as f:
+            _copy_checked(upload, f, max_bytes)
+            f.flush()
+            os.fsync(f.fileno())
+        locator.invalidate()
+    return target
+
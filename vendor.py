@@ -0,0 +1,312 @@
+"""Icônes et polices auto-hébergées (plus d'appels à des CDN tiers au rendu).
+
+Étape de build :
+
+    python vendor.py [--offline]
+
+* télécharge une fois les logos des compétences (simpleicons.org) dans
+  ``vendor/icons/`` ;
+* télécharge les polices Google Fonts déclarées par ``style.css`` dans
+  ``vendor/fonts/src/`` puis les réduit (fontTools, optionnel) aux seuls
+  glyphes utilisés par le site, dans ``vendor/fonts/`` ;
+* récupère l'image de chaque projet (URL distante, ou chemin local relatif
+  au dépôt) dans ``vendor/projects/`` ; l'app la sert ensuite recadrée au
+  format de la carte, en WebP (voir ``images.card_image``).
+
+Les téléchargements passent par un ``Fetcher`` interchangeable
+(``http_fetch`` par défaut) : des fichiers de test peuvent remplacer le réseau.
+
+``vendor/`` sert de cache : avec ``--offline`` rien n'est téléchargé et le
+build repart des fichiers déjà présents. Au rendu, tant qu'un fichier local
+manque, l'app retombe sur l'URL du CDN d'origine.
+"""
+import argparse
+import hashlib
+import html
+import io
+import json
+import os
+import re
+import string
+from typing import Callable
+
+import static_pages
+from assets import atomic_write, static_url
+from content import Content, Project, Skill, load_content
+from images import card_image
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+VENDOR_DIR = os.path.join(BASE_DIR, "vendor")
+ICONS_DIR = os.path.join(VENDOR_DIR, "icons")
+FONTS_DIR = os.path.join(VENDOR_DIR, "fonts")
+FONTS_SRC_DIR = os.path.join(FONTS_DIR, "src")
+FONT_MANIFEST = os.path.join(FONTS_DIR, "fonts.json")
+PROJECTS_DIR = os.path.join(VENDOR_DIR, "projects")
+
+# fetch(url, en-têtes) -> contenu ; lève une exception en cas d'échec.
+Fetcher = Callable[[str, dict], bytes]
+
+# Google Fonts ne sert du WOFF2 qu'aux navigateurs récents.
+BROWSER_UA = (
+    "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 "
+    "(KHTML, like Gecko) Chrome/124.0 Safari/537.36"
+)
+_FONTS_IMPORT = re.compile(r"@import url\('(https://fonts\.googleapis\.com/[^']+)'\);\s*")
+_FONT_FACE = re.compile(r"/\* ([\w-]+) \*/\s*@font-face\s*{(.*?)}", re.S)
+_TAG = re.compile(r"<[^>]+>")
+
+
+# ──────────────────────────────────────────────
+# RENDU : URL DES FICHIERS LOCAUX
+# ──────────────────────────────────────────────
+def icon_file(skill: Skill) -> str:
+    return os.path.join(ICONS_DIR, f"{skill.icon}-{skill.color.lower()}.svg")
+
+
+def icon_url(skill: Skill) -> str:
+    """Logo servi localement s'il a été vendorisé, sinon URL du CDN."""
+    return static_url(icon_file(skill)) or skill.logo_url
+
+
+def project_source(project: Project) -> str | None:
+    """Fichier local de l'image du projet, s'il a été récupéré (ou fourni)."""
+    url = project.image_url
+    if url.startswith(("http://", "https://")):
+        digest = hashlib.sha256(url.encode()).hexdigest()[:16]
+        path = os.path.join(PROJECTS_DIR, f"project-{digest}")
+    else:
+        path = os.path.join(BASE_DIR, url)
+    return path if os.path.isfile(path) else None
+
+
+def project_image(project: Project) -> str:
+    """Image locale optimisée du projet, sinon l'URL d'origine."""
+    src = project_source(project)
+    local = src and card_image(src, static_pages.PROJECT_IMAGE_SIZE,
+                               alt=project.title, css_class="project-image")
+    return local or static_pages.remote_image(project)
+
+
+def version() -> str:
+    """Change dès que le contenu de vendor/ change (invalide les fragments)."""
+    parts = []
+    for path in (ICONS_DIR, FONT_MANIFEST, PROJECTS_DIR):
+        try:
+            parts.append(str(os.stat(path).st_mtime_ns))
+        except FileNotFoundError:
+            parts.append("-")
+    return ".".join(parts)
+
+
+def load_font_manifest() -> list[dict]:
+    try:
+        with open(FONT_MANIFEST, encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return []
+
+
+def font_face_css(url_for: Callable[[str], str | None] = static_url) -> str | None:
+    """Règles @font-face des polices locales, ou None si elles manquent."""
+    rules = []
+    for face in load_font_manifest():
+        url = url_for(os.path.join(FONTS_DIR, face["file"]))
+        if url is None:
+            return None
+        rules.append(
+            f"@font-face{{font-family:'{face['family']}';font-style:{face['style']};"
+            f"font-weight:{face['weight']};font-display:swap;"
+            f"src:url({url}) format('woff2')}}"
+        )
+    return "\n".join(rules) or None
+
+
+_localized: tuple[tuple[int, str], str] | None = None
+
+
+def localize_css(css: str, url_for: Callable[[str], str | None] | None = None) -> str:
+    """Remplace l'@import Google Fonts par les polices locales si disponibles.
+
+    Sans `url_for` (cas de l'app), le résultat est mémorisé par
+    (feuille de style, version de vendor/).
+    """
+    global _localized
+    if url_for is None:
+        key = (hash(css), version())
+        cached = _localized
+        if cached and cached[0] == key:
+            return cached[1]
+    faces = font_face_css(url_for or static_url)
+    result = _FONTS_IMPORT.sub(lambda _: faces + "\n", css, count=1) if faces else css
+    if url_for is None:
+        _localized = (key, result)
+    return result
+
+
+# ──────────────────────────────────────────────
+# BUILD
+# ──────────────────────────────────────────────
+def http_fetch(url: str, headers: dict) -> bytes:
+    import requests
+
+    r = requests.get(url, headers=headers, timeout=20)
+    r.raise_for_status()
+    return r.content
+
+
+def _write(dest: str, data: bytes) -> None:
+    os.makedirs(os.path.dirname(dest), exist_ok=True)
+    atomic_write(dest, data)
+
+
+def _download(url: str, dest: str, offline: bool, headers: dict | None = None,
+              fetch: Fetcher = http_fetch) -> bool:
+    """Télécharge `url` vers `dest` sauf si le cache l'a déjà ; True si présent."""
+    if os.path.isfile(dest):
+        return True
+    if offline:
+        return False
+    _write(dest, fetch(url, headers or {}))
+    return True
+
+
+def vendor_icons(content: Content, offline: bool = False,
+                 fetch: Fetcher = http_fetch) -> list[str]:
+    """Met en cache local le logo de chaque compétence ; retourne les manquants."""
+    missing = []
+    for category in content.skills:
+        for skill in category.items:
+            try:
+                ok = _download(skill.logo_url, icon_file(skill), offline, fetch=fetch)
+            except Exception as exc:
+                print(f"  ! {skill.logo_url} : {exc}")
+                ok = False
+            if not ok:
+                missing.append(skill.name)
+    return missing
+
+
+def vendor_project_images(content: Content, offline: bool = False,
+                          fetch: Fetcher = http_fetch) -> list[str]:
+    """Récupère l'image de chaque projet une seule fois ; retourne les manquants.
+
+    Le contenu téléchargé est décodé avant d'être gardé : une page d'erreur
+    HTML servie avec un 200 n'entre pas dans le cache.
+    """
+    from PIL import Image
+
+    missing = []
+    for project in content.projects:
+        url = project.image_url
+        if project_source(project):
+            continue
+        if offline or not url.startswith(("http://", "https://")):
+            missing.append(project.title)
+            continue
+        digest = hashlib.sha256(url.encode()).hexdigest()[:16]
+        try:
+            data = fetch(url, {"User-Agent": BROWSER_UA})
+            with Image.open(io.BytesIO(data)) as img:
+                img.verify()
+        except Exception as exc:
+            print(f"  ! {url} : {exc}")
+            missing.append(project.title)
+            continue
+        _write(os.path.join(PROJECTS_DIR, f"project-{digest}"), data)
+    return missing
+
+
+def site_text(content: Content) -> str:
+    """Tous les caractères affichés par le site (base du sous-ensemble de glyphes)."""
+    pages = [
+        static_pages.nav_html("home"),
+        static_pages.FOOTER_HTML,
+        static_pages.home_html(content, ""),
+        static_pages.contact_html(),
+    ] + [build(content) for build in static_pages.BUILDERS.values()]
+    text = html.unescape(_TAG.sub(" ", "\n".join(pages)))
+    return "".join(sorted(set(text + string.printable)))
+
+
+def _subset(src: str, dest: str, text: str) -> None:
+    try:
+        from fontTools import subset
+    except ImportError:
+        # fontTools absent : police complète, mais servie localement.
+        with open(src, "rb") as f, open(dest, "wb") as out:
+            out.write(f.read())
+        return
+    options = subset.Options()
+    options.flavor = "woff2"
+    options.layout_features = ["*"]
+    font = subset.load_font(src, options)
+    subsetter = subset.Subsetter(options)
+    subsetter.populate(text=text)
+    subsetter.subset(font)
+    subset.save_font(font, dest, options)
+
+
+def vendor_fonts(content: Content, offline: bool = False,
+                 fetch: Fetcher = http_fetch) -> list[dict]:
+    """Télécharge, réduit et déclare les polices ; retourne le manifeste écrit."""
+    with open(os.path.join(BASE_DIR, "style.css"), encoding="utf-8") as f:
+        m = _FONTS_IMPORT.search(f.read())
+    if not m:
+        return []
+    css_cache = os.path.join(FONTS_SRC_DIR, "google-fonts.css")
+    if not _download(m.group(1), css_cache, offline,
+                     headers={"User-Agent": BROWSER_UA}, fetch=fetch):
+        return []
+    with open(css_cache, encoding="utf-8") as f:
+        google_css = f.read()
+
+    text = site_text(content)
+    manifest, done = [], {}
+    for subset_name, block in _FONT_FACE.findall(google_css):
+        if subset_name != "latin":
+            continue
+        props = dict(re.findall(r"([\w-]+):\s*([^;]+);", block))
+        url = re.search(r"url\(([^)]+)\)", props["src"]).group(1)
+        family = props["font-family"].strip("'\"")
+        if url not in done:
+            src = os.path.join(FONTS_SRC_DIR, os.path.basename(url))
+            if not _download(url, src, offline, fetch=fetch):
+                return []
+            name = f"{family.replace(' ', '')}-{os.path.basename(url)}"
+            _subset(src, os.path.join(FONTS_DIR, name), text)
+            done[url] = name
+        manifest.append({
+            "family": family,
+            "style": props["font-style"],
+            "weight": props["font-weight"],
+            "file": done[url],
+        })
+
+    atomic_write(FONT_MANIFEST, json.dumps(manifest, indent=2))
+    return manifest
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Vendorise icônes et polices du portfolio.")
+    parser.add_argument("--offline", action="store_true",
+                        help="n'utiliser que le cache local vendor/ (aucun téléchargement)")
+    args = parser.parse_args()
+
+    content = load_content()
+    missing = vendor_icons(content, args.offline)
+    print(f"Icônes : {sum(len(c.items) for c in content.skills) - len(missing)} en local"
+          + (f", manquantes : {', '.join(missing)}" if missing else ""))
+    missing = vendor_project_images(content, args.offline)
+    print(f"Images projets : {len(content.projects) - len(missing)} en local"
+          + (f", manquantes : {', '.join(missing)}" if missing else ""))
+    try:
+        faces = vendor_fonts(content, args.offline)
+    except Exception as exc:
+        print(f"Polices : échec ({exc})")
+    else:
+        print(f"Polices : {len(faces)} variantes en local" if faces
+              else "Polices : cache absent, @import Google Fonts conservé")
+
+
+if __name__ == "__main__":
+    main()
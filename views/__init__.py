@@ -0,0 +1,20 @@
+"""Pages du portfolio, une par module, importées à la demande par ``router.py``.
+
+Chaque module expose ``render(page)``. Ce paquet ne s'appelle pas ``pages``
+pour ne pas déclencher le mode multipage de Streamlit.
+"""
+import streamlit as st
+
+import metrics
+
+
+def render_html(body: str) -> None:
+    """``st.html`` avec comptage de la taille du payload envoyé."""
+    if metrics.ENABLED:
+        metrics.observe_size(f"st_html.{st.session_state.get('page')}", len(body.encode()))
+    st.html(body)
+
+
+def local_assets() -> bool:
+    """Serveur statique actif : assets servis depuis static/ et vendor/."""
+    return st.get_option("server.enableStaticServing")
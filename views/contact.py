@@ -0,0 +1,105 @@
+"""Page de contact : formulaire (fragment), validation et mise en file."""
+import streamlit as st
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+import metrics
+from contact import FORMSPREE_ID, RateLimited, dedup, http_stats, limiter, queue_message
+from fragments import fragment_cache
+from static_pages import TEMPLATE_VERSION, contact_html
+from validation import FIELDS, mailto_body, mailto_url, normalize, validate
+from views import render_html
+
+# Jauges de l'envoi, déclarées au premier import de la page (comme le module
+# contact, qui n'est chargé qu'à la première visite du formulaire).
+metrics.register("formspree", http_stats)
+metrics.register("rate_limiter", limiter.stats)
+metrics.register("dedup", dedup.stats)
+
+
+def submit_contact():
+    """Validation puis envoi ; callback, donc exécuté avant le nouveau rendu."""
+    fields = normalize({k: st.session_state[f"contact_{k}"] for k in FIELDS})
+    errors = validate(fields)
+    st.session_state.contact_errors = errors
+    st.session_state.contact_notice = None
+    st.session_state.contact_mailto = None
+    if errors:
+        return
+
+    # ── Envoi ──
+    if FORMSPREE_ID:
+        # Enregistré dans l'outbox ; envoi HTTP en arrière-plan,
+        # avec nouvelles tentatives en cas d'échec temporaire.
+        ctx = get_script_run_ctx()
+        try:
+            queue_message(**fields, session_id=ctx.session_id if ctx else "")
+        except RateLimited as exc:
+            st.session_state.contact_errors = [
+                f"Trop de messages envoyés : réessayez dans {exc.retry_after:.0f} s."
+            ]
+        except Exception as exc:
+            st.session_state.contact_errors = [f"Impossible d'enregistrer le message : {exc}"]
+            st.session_state.contact_notice = (
+                "💡 En attendant, écrivez directement à : enjipang@gmail.com"
+            )
+        else:
+            st.session_state.form_sent = True
+    else:
+        # Fallback : mailto (ouvre le client email local)
+        st.session_state.contact_mailto = mailto_url(
+            "enjipang@gmail.com", fields["subject"], mailto_body(fields)
+        )
+        st.session_state.contact_notice = (
+            "⚠️ Formspree non configuré — votre client email s'ouvre.\n\n"
+            "Pour activer l'envoi automatique, renseignez `FORMSPREE_ID` dans le code."
+        )
+
+
+def reset_contact():
+    st.session_state.form_sent = False
+    st.session_state.contact_errors = []
+    st.session_state.contact_notice = None
+
+
+# Le formulaire est un fragment : saisie, validation et envoi ne
+# ré-exécutent que cette zone (pas la navigation, les cartes ni le CSS).
+# Les boutons passent par des callbacks : pas besoin de st.rerun().
+@st.fragment
+def contact_form():
+    if "form_sent" not in st.session_state:
+        st.session_state.form_sent = False
+
+    if st.session_state.form_sent:
+        st.success("✅ Message bien reçu ! Je vous répondrai sous 24h.")
+        st.balloons()
+        st.button("Envoyer un autre message", on_click=reset_contact)
+        return
+
+    with st.form(key="contact_form", clear_on_submit=False):
+        col1, col2 = st.columns(2)
+        with col1:
+            st.text_input("Nom complet *", placeholder="Jean Dupont", key="contact_name")
+            st.text_input("Email *", placeholder="jean@example.com", key="contact_email")
+        with col2:
+            st.text_input("Sujet *", placeholder="Opportunité / Projet / Question",
+                          key="contact_subject")
+            st.text_input("Téléphone (optionnel)", placeholder="+237 6XX XX XX XX",
+                          key="contact_phone")
+        st.text_area("Message *", height=150, key="contact_message",
+                     placeholder="Décrivez votre projet ou votre demande...")
+        st.form_submit_button("📨 Envoyer le message", type="primary",
+                              use_container_width=False, on_click=submit_contact)
+
+    for e in st.session_state.get("contact_errors", []):
+        st.error(f"❌ {e}")
+    mailto = st.session_state.get("contact_mailto")
+    if mailto:
+        st.session_state.contact_mailto = None  # une seule redirection
+        render_html(f'<meta http-equiv="refresh" content="0;url={mailto}">')
+    if st.session_state.get("contact_notice"):
+        st.info(st.session_state.contact_notice)
+
+
+def render(page: str) -> None:
+    render_html(fragment_cache.get("contact", TEMPLATE_VERSION, contact_html))
+    contact_form()
@@ -0,0 +1,174 @@
+"""Page d'accueil : présentation, photo et téléchargement du CV."""
+import base64
+import os
+
+import streamlit as st
+
+import metrics
+import sessions
+import static_pages
+from assets import static_url
+from content import load_content
+from fragments import fragment_cache
+from images import profile_photo
+from loaders import cv_locator, read_bytes
+from uploads import UPLOAD_TOKEN, UploadRejected, check_pdf, is_owner, promote_cv
+from views import local_assets, render_html
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PHOTO = os.path.join(BASE_DIR, "My_Photo.jpeg")
+
+
+@metrics.timed("get_image_base64")
+def get_image_base64(path: str) -> str | None:
+    data = read_bytes(path)
+    return base64.b64encode(data).decode() if data is not None else None
+
+
+@metrics.timed("get_photo_html")
+def get_photo_html(path: str, local: bool) -> tuple[str, str] | None:
+    """Balises (vignette, lightbox) de la photo de profil.
+
+    Avec le serveur statique : déclinaisons <picture> redimensionnées et
+    cacheables. Sinon : data-URI base64 (ancien comportement).
+    """
+    if local:
+        photo = profile_photo(path)
+        if photo:
+            return photo
+    img_b64 = get_image_base64(path)
+    if not img_b64:
+        return None
+    photo_src = f"data:image/jpeg;base64,{img_b64}"
+    return f'<img src="{photo_src}">', f'<img src="{photo_src}" class="lightbox-content">'
+
+
+def home_body(local: bool) -> str:
+    """HTML de l'accueil, reconstruit si le contenu ou la photo changent."""
+    content = load_content()
+    try:
+        photo_version = os.stat(PHOTO).st_mtime_ns
+    except FileNotFoundError:
+        photo_version = 0
+    version = f"{static_pages.TEMPLATE_VERSION}:{content.version}:{photo_version}"
+
+    def build() -> str:
+        with metrics.Timer("build.home"):
+            return static_pages.home_html(
+                content, static_pages.photo_block_html(get_photo_html(PHOTO, local))
+            )
+
+    return fragment_cache.get(f"home:{int(local)}", version, build)
+
+
+@metrics.timed("find_cv_file")
+def find_cv_file() -> str | None:
+    return cv_locator.find()
+
+
+def release_cv_upload() -> None:
+    """Le CV déposé est publié, téléchargé ou refusé : on libère ses octets."""
+    st.session_state.cv_upload_gen = st.session_state.get("cv_upload_gen", 0) + 1
+    sessions.release_uploads()
+
+
+def upload_token() -> str:
+    """Jeton de publication du CV : ``PORTFOLIO_UPLOAD_TOKEN``, sinon
+    ``upload_token`` de .streamlit/secrets.toml ; vide si aucun."""
+    if UPLOAD_TOKEN:
+        return UPLOAD_TOKEN
+    try:
+        return str(st.secrets.get("upload_token", ""))
+    except FileNotFoundError:   # pas de secrets.toml
+        return ""
+
+
+def publish_cv_upload(uploaded) -> None:
+    """Installe le CV déposé par le propriétaire comme CV du site."""
+    try:
+        promote_cv(uploaded)
+    except UploadRejected as exc:
+        st.error(f"❌ {exc}")
+    except OSError as exc:
+        st.error(f"❌ Impossible d'enregistrer le CV : {exc}")
+    else:
+        release_cv_upload()
+        st.rerun()
+
+
+def render(page: str) -> None:
+    local = local_assets()
+    render_html(home_body(local))
+
+    # ── CV download ───────────────────────────────────────────────────────────
+    # Avec le serveur statique, le PDF n'est lu qu'au clic (lien direct,
+    # ETag / Range gérés par le serveur) ; sinon repli sur download_button.
+    cv_path  = find_cv_file()
+    cv_url   = static_url(cv_path) if cv_path and local else None
+    cv_bytes = read_bytes(cv_path) if cv_path and not cv_url else None
+    cv_name  = os.path.basename(cv_path) if cv_path else "CV_NJIPANG_Eraste.pdf"
+
+    col_dl, col_up, _ = st.columns([1, 1.4, 2])
+
+    with col_dl:
+        if cv_url:
+            render_html(
+                f'<a class="btn-primary cv-download" href="{cv_url}" '
+                f'download="{cv_name}" target="_blank">📄 Télécharger mon CV</a>'
+            )
+        elif cv_bytes:
+            st.download_button(
+                label="📄 Télécharger mon CV",
+                data=cv_bytes,
+                file_name=cv_name,
+                mime="application/pdf",
+                use_container_width=True,
+            )
+        else:
+            st.markdown(
+                '<p style="font-size:13px;color:#6B7280;margin-top:8px;">'
+                '📄 CV non trouvé dans le dossier</p>',
+                unsafe_allow_html=True,
+            )
+
+    with col_up:
+        if not (cv_url or cv_bytes):
+            # Permet à l'auteur d'uploader son CV directement depuis l'interface.
+            # Avec le jeton, le PDF vérifié devient le CV du site (voir
+            # uploads.py) ; la clé change ensuite : le widget est recréé vide
+            # et les octets déposés ne restent pas en mémoire de session.
+            # Sans jeton, le fichier vérifié reste propre à la session du
+            # visiteur, et libéré dès qu'il l'a téléchargé.
+            token = upload_token()
+            if token:
+                st.text_input(
+                    "Jeton auteur",
+                    type="password",
+                    key="cv_owner_token",
+                    placeholder="Jeton auteur (publier le CV)",
+                    label_visibility="collapsed",
+                )
+            uploaded = st.file_uploader(
+                "Déposez votre CV ici",
+                type=["pdf"],
+                key=f"cv_upload_{st.session_state.get('cv_upload_gen', 0)}",
+                label_visibility="collapsed",
+                help="Glissez-déposez votre CV PDF pour activer le bouton de téléchargement",
+            )
+            if uploaded and is_owner(st.session_state.get("cv_owner_token", ""), token):
+                publish_cv_upload(uploaded)
+            elif uploaded:
+                try:
+                    st.download_button(
+                        label="📄 Télécharger le CV déposé",
+                        data=check_pdf(uploaded),
+                        file_name=uploaded.name,
+                        mime="application/pdf",
+                        use_container_width=True,
+                        on_click=release_cv_upload,
+                    )
+                except UploadRejected as exc:
+                    release_cv_upload()
+                    st.error(f"❌ {exc}")
+
+    st.empty()
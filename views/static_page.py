@@ -0,0 +1,7 @@
+"""Pages statiques : about, skills, projects, experience."""
+from fragments import page_html
+from views import local_assets, render_html
+
+
+def render(page: str) -> None:
+    render_html(page_html(page, local_assets()))